@@ -9,6 +9,7 @@ task automation system and not covered by the other specialized modules.
 from __future__ import annotations
 
 import datetime
+import functools
 import pathlib
 import re
 import subprocess
@@ -160,10 +161,27 @@ def get_git_root(path: pathlib.Path | None = None) -> pathlib.Path | None:
     if path is None:
         path = pathlib.Path.cwd()
 
+    return _find_git_root(pathlib.Path(path).resolve())
+
+
+@functools.cache
+def _find_git_root(start: pathlib.Path) -> pathlib.Path | None:
+    """
+    Ask git for the repository root containing a resolved start directory.
+
+    Cached per start directory so repeated lookups skip the subprocess; call
+    ``_find_git_root.cache_clear()`` after creating or removing a repository.
+
+    Args:
+        start: Resolved directory to run git from
+
+    Returns:
+        Path to git root or None if not in a git repository
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
-            cwd=path,
+            cwd=start,
             capture_output=True,
             text=True,
             check=True,
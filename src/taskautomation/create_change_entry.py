@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as _dt
+import functools
 import pathlib
 import re
 import subprocess
@@ -123,6 +124,31 @@ def branch() -> str:
         return "unknown-branch"
 
 
+@functools.lru_cache(maxsize=8)
+def _read_project_version(pyproject_file: pathlib.Path, mtime_ns: int, size: int) -> str:
+    """
+    Parse the project version out of a pyproject.toml file.
+
+    The modification time and size are part of the cache key, so an edited file
+    is parsed again while repeated lookups of an unchanged one are free.
+
+    Parameters
+    ----------
+    pyproject_file : pathlib.Path
+        Path to pyproject.toml file.
+    mtime_ns : int
+        File modification time in nanoseconds.
+    size : int
+        File size in bytes.
+
+    Returns
+    -------
+    str
+        The ``project.version`` value.
+    """
+    return tomllib.loads(pyproject_file.read_text())["project"]["version"]
+
+
 def get_version(pyproject_path=None) -> tuple[str, str]:
     """
     Retrieve the project version from the pyproject.toml file.
@@ -141,7 +167,8 @@ def get_version(pyproject_path=None) -> tuple[str, str]:
     """
     pyproject_file = pathlib.Path(pyproject_path) if pyproject_path else PYPROJECT
     try:
-        v = tomllib.loads(pyproject_file.read_text())["project"]["version"]
+        st = pyproject_file.stat()
+        v = _read_project_version(pyproject_file, st.st_mtime_ns, st.st_size)
     except (FileNotFoundError, tomllib.TOMLDecodeError, KeyError) as e:
         print(f"Warning: Could not read version from pyproject.toml: {e}", file=sys.stderr)
         v = "0.0.0"
@@ -191,6 +218,9 @@ def utc_slug() -> str:
     return _dt.datetime.now(_dt.UTC).strftime("%Y%m%dT%H%M%SZ")
 
 
+FIRST_TASK_LINE = re.compile(r"^- \[ \] \*\*(.+?)\*\*:", re.M)
+
+
 def get_first_task(tasks_md_path=None) -> str | None:
     """
     Retrieve the first unchecked task from the TASKS.md file.
@@ -208,7 +238,7 @@ def get_first_task(tasks_md_path=None) -> str | None:
     tasks_file = pathlib.Path(tasks_md_path) if tasks_md_path else TASKS_MD
     if not tasks_file.exists():
         return None
-    m = re.search(r"^- \[ \] \*\*(.+?)\*\*:", tasks_file.read_text(), re.M)
+    m = FIRST_TASK_LINE.search(tasks_file.read_text())
     return m.group(1) if m else None
 
 
@@ -246,6 +276,7 @@ def first_task(root_override=None) -> OperationResult:
 
 # --------------------------------------------------------------------------- #
 COV_LINE = re.compile(r"^TOTAL\s+\d+\s+\d+\s+\d+\s+(\d+)%", re.M)
+COV_SUMMARY = re.compile(r"coverage:\s+(\d+(?:\.\d+)?)% of")
 FAIL_LINE = re.compile(r"^FAILED .+", re.M)
 
 
@@ -267,9 +298,8 @@ def run_tests(cmd: str) -> tuple[str | None, list[str]]:
     """
     cp = run(cmd, check=False)
     if cp.returncode == 0:
-        m = COV_LINE.search(cp.stdout)
-        alt = re.search(r"coverage:\s+(\d+(?:\.\d+)?)% of", cp.stdout)
-        pct = m.group(1) if m else (alt.group(1) if alt else "")
+        m = COV_LINE.search(cp.stdout) or COV_SUMMARY.search(cp.stdout)
+        pct = m.group(1) if m else ""
         return pct, []
     # tests failed
     fails = FAIL_LINE.findall(cp.stdout)
@@ -20,6 +20,7 @@ import datetime
 import os
 import pathlib
 import shutil
+import stat
 import subprocess
 import sys
 from typing import Any
@@ -613,6 +614,34 @@ def load_yaml_file(file_path: pathlib.Path) -> OperationResult:
 # =============================================================================
 
 
+def _parent_state(parent: pathlib.Path, cache: dict[pathlib.Path, str]) -> str:
+    """
+    Classify a parent directory as "missing", "readonly" or "ok", memoized in cache.
+
+    Parameters
+    ----------
+    parent : pathlib.Path
+        Directory that would receive a new file
+    cache : dict[pathlib.Path, str]
+        Per-call lookup shared by sibling targets
+
+    Returns
+    -------
+    str
+        The directory state
+    """
+    state = cache.get(parent)
+    if state is None:
+        if not parent.exists():
+            state = "missing"
+        elif not os.access(parent, os.W_OK):
+            state = "readonly"
+        else:
+            state = "ok"
+        cache[parent] = state
+    return state
+
+
 def verify_operation_safety(
     operation: str, target_files: list[pathlib.Path], dry_run: bool = True
 ) -> ValidationResult:
@@ -641,19 +670,26 @@ def verify_operation_safety(
         "dry_run": dry_run,
     }
 
-    # Check file permissions
+    # Check file permissions; sibling targets share one parent directory lookup
+    parent_states: dict[pathlib.Path, str] = {}
     for file_path in target_files:
-        if file_path.exists():
-            if not file_path.is_file():
+        # One stat() answers both "exists" and "is a regular file"
+        try:
+            mode: int | None = file_path.stat().st_mode
+        except OSError:
+            mode = None
+        if mode is not None:
+            if not stat.S_ISREG(mode):
                 errors.append(f"Target is not a file: {file_path}")
             elif not os.access(file_path, os.W_OK):
                 errors.append(f"No write permission: {file_path}")
         else:
             # Check parent directory permissions
             parent = file_path.parent
-            if not parent.exists():
+            state = _parent_state(parent, parent_states)
+            if state == "missing":
                 warnings.append(f"Parent directory will be created: {parent}")
-            elif not os.access(parent, os.W_OK):
+            elif state == "readonly":
                 errors.append(f"No write permission for parent directory: {parent}")
 
     # Git repository checks - inline implementation to avoid circular imports
@@ -101,25 +101,22 @@ def get_git_info() -> dict[str, Any]:
         "has_uncommitted": False,
     }
 
-    # Get current branch name
-    success, branch, _ = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])
-    if success:
-        info["branch"] = branch
-
-    # Get current commit hash (short form)
-    success, commit, _ = run_git_command(["rev-parse", "HEAD"])
+    # Get current commit hash and branch name in a single invocation
+    success, revs, _ = run_git_command(["rev-parse", "HEAD", "--abbrev-ref", "HEAD"])
     if success:
+        commit, _, branch = revs.partition("\n")
         info["commit"] = commit[:8]  # Short hash
+        info["branch"] = branch
 
-    # Get git user name configuration
-    success, name, _ = run_git_command(["config", "user.name"])
-    if success:
-        info["user_name"] = name
-
-    # Get git user email configuration
-    success, email, _ = run_git_command(["config", "user.email"])
+    # Get git user name and email configuration in a single invocation
+    success, user_config, _ = run_git_command(["config", "--get-regexp", r"^user\.(name|email)$"])
     if success:
-        info["user_email"] = email
+        for line in user_config.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "user.name":
+                info["user_name"] = value
+            elif key == "user.email":
+                info["user_email"] = value
 
     # Check working directory status for uncommitted changes
     success, status, _ = run_git_command(["status", "--porcelain"])
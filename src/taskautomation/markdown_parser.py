@@ -8,15 +8,64 @@ legacy TASKS.md markdown format used by the task automation system.
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from .core_utils import (
-    METADATA_RE,
     SUBTASK_RE,
-    TASK_BLOCK_RE,
     TaskInfo,
 )
 
+# Line prefixes that open a task's nested prerequisite and subtask lists
+_PREREQUISITE_PREFIXES = ("- **Pre-requisites**:", "- **Prerequisites**:")
+_SUBTASKS_PREFIX = "- **Subtasks**:"
+
+# Longest content parse_existing_tasks memoizes; larger files are parsed uncached
+_PARSE_CACHE_MAX_CHARS = 64 * 1024
+
+
+def _split_task_header(line: str) -> tuple[bool, str] | None:
+    """
+    Read a ``- [ ] **Title**:`` header line without entering the regex engine.
+
+    Matches exactly the lines ``TASK_BLOCK_RE`` does: a ``[ ]`` or ``[x]``
+    checkbox and a non-empty title ending at the first ``**:``.
+
+    Args:
+        line: Raw line from TASKS.md
+
+    Returns:
+        (checked, title) pair, or None if the line is not a task header
+    """
+    if not line.startswith("- [") or line[4:8] != "] **" or line[3] not in " x":
+        return None
+    end = line.find("**:", 9)
+    if end == -1:
+        return None
+    return line[3] == "x", line[8:end]
+
+
+def _split_metadata(stripped: str) -> tuple[str, str] | None:
+    """
+    Split a stripped ``- **Key**: value`` line without entering the regex engine.
+
+    Matches exactly the lines ``METADATA_RE`` does: a non-empty key ending at the
+    first ``**: `` and a non-empty value.
+
+    Args:
+        stripped: Task body line with surrounding whitespace removed
+
+    Returns:
+        (key, value) pair, or None if the line is not a metadata line
+    """
+    if not stripped.startswith("- **"):
+        return None
+    end = stripped.find("**: ", 5)
+    if end == -1 or end + 4 == len(stripped):
+        return None
+    return stripped[4:end], stripped[end + 4 :]
+
+
 # =============================================================================
 # Task Parsing Functions (Enhanced from run_tests.py)
 # =============================================================================
@@ -29,6 +78,36 @@ def parse_existing_tasks(task_text: str) -> dict[str, TaskInfo]:
     Args:
         task_text: Content of TASKS.md file
 
+    Returns:
+        Dict mapping task title -> TaskInfo
+    """
+    if len(task_text) > _PARSE_CACHE_MAX_CHARS:
+        return _parse_task_blocks(task_text)
+
+    # Hand out fresh lists and dicts so callers cannot mutate the memoized tasks
+    return {
+        title: task._replace(prerequisites=list(task.prerequisites), subtasks=dict(task.subtasks))
+        for title, task in _parse_task_blocks_cached(task_text)
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_task_blocks_cached(task_text: str) -> tuple[tuple[str, TaskInfo], ...]:
+    """
+    Parse task blocks, memoized on the content.
+
+    Repeated loads of an unchanged TASKS.md skip the line walk entirely.
+
+    Returns:
+        Tuple of (title, TaskInfo) pairs in document order
+    """
+    return tuple(_parse_task_blocks(task_text).items())
+
+
+def _parse_task_blocks(task_text: str) -> dict[str, TaskInfo]:
+    """
+    Walk TASKS.md content line by line and build a TaskInfo per task block.
+
     Returns:
         Dict mapping task title -> TaskInfo
     """
@@ -37,12 +116,10 @@ def parse_existing_tasks(task_text: str) -> dict[str, TaskInfo]:
 
     i = 0
     while i < len(lines):
-        line = lines[i]
-        task_match = TASK_BLOCK_RE.match(line)
+        header = _split_task_header(lines[i])
 
-        if task_match:
-            checked = task_match.group(1) == "x"
-            title = task_match.group(2)
+        if header:
+            checked, title = header
 
             # Initialize task data with defaults
             task_data: dict[str, Any] = {
@@ -68,19 +145,20 @@ def parse_existing_tasks(task_text: str) -> dict[str, TaskInfo]:
             i += 1
             while i < len(lines):
                 line = lines[i]
+                stripped = line.strip()
 
                 # Check for next task or end of current task
-                if line.strip() == "" and i + 1 < len(lines) and lines[i + 1].startswith("- ["):
+                if not stripped and i + 1 < len(lines) and lines[i + 1].startswith("- ["):
                     break
-                if TASK_BLOCK_RE.match(line):
+                if _split_task_header(line):
                     i -= 1  # Back up to reprocess this line
                     break
 
                 # Parse metadata
-                metadata_match = METADATA_RE.match(line.strip())
-                if metadata_match:
-                    key = metadata_match.group(1).lower().replace(" ", "_")
-                    value = metadata_match.group(2).strip()
+                metadata = _split_metadata(stripped)
+                if metadata:
+                    key = metadata[0].lower().replace(" ", "_")
+                    value = metadata[1].strip()
 
                     if key == "id":
                         try:
@@ -100,9 +178,7 @@ def parse_existing_tasks(task_text: str) -> dict[str, TaskInfo]:
                             task_data[key] = value
 
                 # Parse prerequisites
-                if line.strip().startswith("- **Pre-requisites**:") or line.strip().startswith(
-                    "- **Prerequisites**:"
-                ):
+                if stripped.startswith(_PREREQUISITE_PREFIXES):
                     i += 1
                     while i < len(lines) and lines[i].startswith("    - "):
                         prereq = lines[i].strip()[2:]  # Remove "- "
@@ -112,7 +188,7 @@ def parse_existing_tasks(task_text: str) -> dict[str, TaskInfo]:
                     i -= 1  # Back up one line
 
                 # Parse subtasks
-                elif line.strip().startswith("- **Subtasks**:"):
+                elif stripped.startswith(_SUBTASKS_PREFIX):
                     i += 1
                     while i < len(lines) and lines[i].startswith("    - ["):
                         subtask_match = SUBTASK_RE.match(lines[i])
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import datetime
 import json
+from collections import defaultdict
 from typing import Any
 
 import yaml
@@ -323,17 +324,15 @@ def format_task_list_summary(task_list: TaskList, group_by_priority: bool = True
     total_tasks = len(all_tasks)
 
     # Count by priority and status
-    priority_counts: dict[str, int] = {}
-    status_counts: dict[str, int] = {}
+    priority_counts: defaultdict[str, int] = defaultdict(int)
+    status_counts: defaultdict[str, int] = defaultdict(int)
 
     for task in all_tasks:
         # Count by priority
-        priority = task.priority.value if task.priority else "unknown"
-        priority_counts[priority] = priority_counts.get(priority, 0) + 1
+        priority_counts[task.priority.value if task.priority else "unknown"] += 1
 
         # Count by status
-        status = task.status.value if task.status else "unknown"
-        status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts[task.status.value if task.status else "unknown"] += 1
 
     lines.append(f"Total Tasks: {total_tasks}")
 
@@ -397,7 +396,8 @@ def output_result(result: OperationResult, format_type: str = "human", quiet: bo
     format_type : str, optional
         Output format type, either "human" or "json", by default "human"
     quiet : bool, optional
-        If True, suppress non-essential output in human format, by default False
+        If True, suppress non-essential output in human format and emit
+        compact single-line JSON, by default False
 
     Examples
     --------
@@ -422,6 +422,35 @@ def output_result(result: OperationResult, format_type: str = "human", quiet: bo
       ...
     }
     """
+    text = serialize_result(result, format_type, quiet)
+    if text:
+        print(text)
+
+
+def serialize_result(
+    result: OperationResult, format_type: str = "human", quiet: bool = False
+) -> str:
+    """
+    Render an operation result as text without writing it anywhere.
+
+    Produces exactly what output_result prints, so callers that only need
+    the rendered text can skip redirecting stdout.
+
+    Parameters
+    ----------
+    result : OperationResult
+        OperationResult object containing operation outcome and details
+    format_type : str, optional
+        Output format type, either "human" or "json", by default "human"
+    quiet : bool, optional
+        If True, suppress non-essential output in human format and emit
+        compact single-line JSON, by default False
+
+    Returns
+    -------
+    str
+        Rendered result, or an empty string when there is nothing to show
+    """
     if format_type == "json":
         output_data = {
             "success": result.success,
@@ -431,24 +460,26 @@ def output_result(result: OperationResult, format_type: str = "human", quiet: bo
             "errors": result.errors,
             "warnings": result.warnings,
         }
-        print(json.dumps(output_data, indent=2))
-    else:
-        # Human format
-        if not quiet:
-            if result.success:
-                print(f"✓ {result.message}")
-            else:
-                print(f"✗ {result.message}")
-
-            if result.warnings and not quiet:
-                print("Warnings:")
-                for warning in result.warnings:
-                    print(f"  ⚠ {warning}")
-
-            if result.errors:
-                print("Errors:")
-                for error in result.errors:
-                    print(f"  ✗ {error}")
+        if quiet:
+            # Compact output is for machines and lets json use its C encoder
+            return json.dumps(output_data, separators=(",", ":"))
+        return json.dumps(output_data, indent=2)
+
+    # Human format
+    if quiet:
+        return ""
+
+    lines = [f"✓ {result.message}" if result.success else f"✗ {result.message}"]
+
+    if result.warnings:
+        lines.append("Warnings:")
+        lines.extend(f"  ⚠ {warning}" for warning in result.warnings)
+
+    if result.errors:
+        lines.append("Errors:")
+        lines.extend(f"  ✗ {error}" for error in result.errors)
+
+    return "\n".join(lines)
 
 
 def create_structured_error(
@@ -67,6 +67,8 @@ TASKS = _DEFAULT_PATHS["TASKS"]
 FAIL_RE = re.compile(r"^(.+?)::(.+?) FAILED", re.M)  # capture file path and test name
 PASS_RE = re.compile(r"^(.+?)::(.+?) PASSED", re.M)  # capture file path and test name
 SHORT_FAIL_RE = re.compile(r"^FAILED (.+?)::", re.M)  # fallback for file path only
+# pytest-xdist (-n) prints "[gw0] [ 50%] PASSED path::test" instead of "path::test PASSED"
+XDIST_RESULT_RE = re.compile(r"^\[gw\d+\] \[\s*\d+%\] (PASSED|FAILED) (.+?)::(.+?)\s*$", re.M)
 
 # Regex patterns for parsing TASKS.md
 TASK_BLOCK_RE = re.compile(r"- \[([ x])\] \*\*Fix failing tests in (.+?)\*\*:", re.M)
@@ -144,6 +146,11 @@ def parse_test_results(output: str) -> list[TestResult]:
         test_name = match.group(2)
         results.append(TestResult(file_path, test_name, "PASSED"))
 
+    # Parse results reported by pytest-xdist workers
+    for match in XDIST_RESULT_RE.finditer(output):
+        status, file_path, test_name = match.groups()
+        results.append(TestResult(file_path, test_name, status))
+
     return results
 
 
@@ -674,6 +681,7 @@ def main(argv=None, root_override=None):  # noqa: C901
           %(prog)s --coverage html              # Report mode with HTML coverage
           %(prog)s --quiet --update-tasks       # Update TASKS.md quietly
           %(prog)s -- -v -x                     # Forward -v -x to pytest
+          %(prog)s -- -n auto                   # Run tests in parallel (pytest-xdist)
         """),
     )
 
@@ -8,6 +8,7 @@ Replaces the previous regex-based markdown parsing with robust YAML handling.
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -429,15 +430,15 @@ def get_task_summary(task_list: TaskList) -> dict[str, Any]:
     all_tasks = task_list.get_all_tasks()
     archived_tasks = task_list.archive
 
-    # Count by priority
-    priority_counts = {}
-    for priority in Priority:
-        priority_counts[priority.value] = sum(1 for task in all_tasks if task.priority == priority)
+    # Count by priority and status in one pass, then report every level in enum order
+    priority_tally: Counter[Priority] = Counter()
+    status_tally: Counter[TaskStatus] = Counter()
+    for task in all_tasks:
+        priority_tally[task.priority] += 1
+        status_tally[task.status] += 1
 
-    # Count by status
-    status_counts = {}
-    for status in TaskStatus:
-        status_counts[status.value] = sum(1 for task in all_tasks if task.status == status)
+    priority_counts = {priority.value: priority_tally[priority] for priority in Priority}
+    status_counts = {status.value: status_tally[status] for status in TaskStatus}
 
     # Calculate completion rate
     total_active = len(all_tasks)
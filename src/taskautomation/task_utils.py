@@ -57,6 +57,7 @@ from .markdown_parser import (
 )
 from .output_formatter import (
     output_result,
+    serialize_result,
 )
 from .task_schema import Priority, TaskStatus
 from .task_types import (
@@ -71,6 +72,7 @@ from .validation_utils import (
     extract_description,
     extract_finished_date,
     extract_priority,
+    extract_task_fields,
     extract_task_id,
     is_valid_task_line,
     validate_prerequisites,
@@ -125,6 +127,7 @@ __all__ = [
     "extract_description",
     "extract_finished_date",
     "extract_priority",
+    "extract_task_fields",
     "extract_task_id",
     # Parsing functions
     "parse_existing_tasks",
@@ -138,6 +141,7 @@ __all__ = [
     "get_current_branch",
     # Output functions
     "output_result",
+    "serialize_result",
     "create_structured_error",
     # File operations
     "backup_tasks_file",
@@ -10,6 +10,8 @@ the schema validation system.
 from __future__ import annotations
 
 import os
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,12 @@ import yaml
 from .task_schema import Task, TaskList, TaskStatus, ValidationError
 from .task_types import ExitCode, OperationResult, ValidationResult, create_structured_error
 
+# Accepted time estimate formats: "30 minutes", "2 hours", "3 days", "1 week",
+# "2h"/"30m" and "2:30" (hours:minutes)
+_TIME_ESTIMATE_RE = re.compile(
+    r"\d+\s*minutes?|\d+\s*hours?|\d+\s*days?|\d+\s*weeks?|\d+[hm]|\d+:\d+"
+)
+
 
 def validate_task_object(task: Task) -> ValidationResult:
     """
@@ -326,8 +334,6 @@ def validate_automation_environment() -> ValidationResult:
 
     # Check Python environment and required packages
     try:
-        import sys
-
         python_version = f"Python {sys.version_info.major}.{sys.version_info.minor}"
 
         # Check minimum Python version for the features we use
@@ -432,21 +438,7 @@ def _has_circular_dependency(
 
 def _is_valid_time_estimate(time_str: str) -> bool:
     """Check if time estimate string is in a reasonable format."""
-    import re
-
-    time_patterns = [
-        r"\d+\s*minutes?",
-        r"\d+\s*hours?",
-        r"\d+\s*days?",
-        r"\d+\s*weeks?",
-        r"\d+[hm]",  # 2h, 30m
-        r"\d+:\d+",  # 2:30 (hours:minutes)
-    ]
-
-    for pattern in time_patterns:
-        if re.match(pattern, time_str.lower().strip()):
-            return True
-    return False
+    return _TIME_ESTIMATE_RE.match(time_str.lower().strip()) is not None
 
 
 def create_validation_summary(results: list[ValidationResult]) -> dict[str, Any]:
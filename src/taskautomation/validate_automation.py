@@ -27,11 +27,17 @@ Options:
 
 from __future__ import annotations
 
-import argparse
+import copy
+import functools
+import importlib.util
+import json
 import pathlib
+import stat
 import sys
-import traceback
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Mapping
+from operator import attrgetter
+from types import MappingProxyType
 
 # Using proper package imports now
 
@@ -40,18 +46,17 @@ try:
         ExitCode,
         OperationResult,
         TaskInfo,
-        ValidationResult,
         create_structured_error,
         get_current_datetime,
         get_default_root,
         get_git_info,
-        load_tasks_file,
         output_result,
         parse_existing_tasks,
+        run_git_command,
+        serialize_result,
         validate_prerequisites,
         validate_task_data,
         validate_tasks_file,
-        verify_operation_safety,
     )
 except ImportError as e:
     print(f"✗ Failed to import task_utils: {e}")
@@ -59,6 +64,69 @@ except ImportError as e:
     sys.exit(3)
 
 
+# Standard library modules the automation scripts depend on
+REQUIRED_MODULES = (
+    "collections",
+    "datetime",
+    "enum",
+    "json",
+    "pathlib",
+    "re",
+    "shutil",
+    "subprocess",
+    "sys",
+    "os",
+)
+
+# Script files that must exist in SRC_DIR and path keys that must be directories
+REQUIRED_SOURCE_FILES = ("task_utils.py", "run_tests.py", "create_change_entry.py")
+REQUIRED_DIR_KEYS = ("DOCS_DIR", "SRC_DIR", "PLANNING_DIR")
+
+# Known good and bad tasks for the validation self-test
+SELF_TEST_GOOD_TASK = TaskInfo(
+    title="Test Task",
+    checked=False,
+    task_id=1,
+    priority="High",
+    assignee="TestUser",
+    create_date="2025-01-01T12:00:00Z",
+    start_date="2025-01-01T12:00:00Z",
+    finish_date=None,
+    estimated_time="30 minutes",
+    description="Test description",
+    prerequisites=["None"],
+    subtasks={"test_subtask": False},
+    raw_block="- [ ] **Test Task**:\n  - **ID**: 1",
+)
+SELF_TEST_BAD_TASK = TaskInfo(
+    title="",  # Invalid: empty title
+    checked=False,
+    task_id=-1,  # Invalid: negative ID
+    priority="Invalid",  # Invalid: not in allowed priorities
+    assignee="TestUser",
+    create_date="invalid-date",  # Invalid: bad date format
+    start_date="2025-01-01T12:00:00Z",
+    finish_date=None,
+    estimated_time="30 minutes",
+    description="Test description",
+    prerequisites=["None"],
+    subtasks={},
+    raw_block="- [ ] **Bad Task**:\n  - **ID**: -1",
+)
+
+# Task field accessors for the distribution summary
+_get_priority = attrgetter("priority")
+_get_checked = attrgetter("checked")
+
+# Git branch, commit and user config gathered once per process; each lookup spawns git
+# subprocesses. The working tree status changes between checks, so it is never cached.
+_GIT_INFO_CACHE: dict | None = None
+_CACHED_GIT_FIELDS = ("branch", "commit", "user_name", "user_email")
+
+# Passing tasks file validations for this process, keyed by (path, mtime_ns, size)
+_TASKS_VALIDATION_CACHE: dict[tuple[str, int, int], tuple[dict, list[str]]] = {}
+
+
 def get_paths(root_override=None):
     """
     Get configurable paths for validation script.
@@ -79,19 +147,124 @@ def get_paths(root_override=None):
     }
 
 
+def _exception_result(display_name: str, test_name: str, exc: Exception) -> OperationResult:
+    """
+    Build the failure result for a validation test that raised.
+
+    Must be called from the ``except`` block so the active traceback is captured.
+    traceback is only imported here, keeping it off the import path of a clean run.
+
+    Args:
+        display_name: Human-readable test name used in the message
+        test_name: Test name recorded in the result context
+        exc: The exception raised by the test
+
+    Returns:
+        OperationResult describing the exception and its traceback
+    """
+    import traceback
+
+    return create_structured_error(
+        f"{display_name} validation failed with exception",
+        ExitCode.SYSTEM_ERROR,
+        [f"Exception: {exc}", f"Traceback: {traceback.format_exc()}"],
+        {"test_name": test_name},
+    )
+
+
 class AutomationValidator:
     """Comprehensive validator for the task automation system."""
 
-    def __init__(self, quiet: bool = False, format_type: str = "human", root_override=None):
+    # (name, display name, validator method, description), in the order the
+    # comprehensive run executes them
+    _TESTS: tuple[tuple[str, str, str, str], ...] = (
+        (
+            "imports",
+            "Module Imports",
+            "validate_module_imports",
+            "Validate that all required modules can be imported",
+        ),
+        (
+            "structure",
+            "File Structure",
+            "validate_file_structure",
+            "Validate that required files and directories exist",
+        ),
+        (
+            "functions",
+            "Validation Functions",
+            "test_validation_functions",
+            "Test validation functions with known good and bad data",
+        ),
+        (
+            "tasks",
+            "Existing Tasks",
+            "validate_existing_tasks",
+            "Validate existing tasks file if it exists",
+        ),
+        ("git", "Git Integration", "test_git_integration", "Test git integration functions"),
+        ("output", "Output Formats", "test_output_formats", "Test JSON and human output formats"),
+    )
+    # Read-only lookups derived from _TESTS
+    _TEST_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(
+        {name: display for name, display, _, _ in _TESTS}
+    )
+    _TEST_DESCRIPTIONS: Mapping[str, str] = MappingProxyType(
+        {name: desc for name, _, _, desc in _TESTS}
+    )
+    _TEST_NAMES: frozenset[str] = frozenset(_TEST_DISPLAY_NAMES)
+
+    def __init__(
+        self,
+        quiet: bool = False,
+        format_type: str = "human",
+        root_override=None,
+        keep_results: bool = True,
+    ):
         self.quiet = quiet
         self.format_type = format_type
+        # Individual results are only retained for callers that inspect them;
+        # the summary is built from the running counters below
+        self.keep_results = keep_results
         self.results: list[OperationResult] = []
         self.overall_success = True
+        self._total = 0
+        self._passed = 0
+        self._total_errors = 0
+        self._total_warnings = 0
+        self.skipped_tests: list[str] = []
         self.paths = get_paths(root_override)
+        self.required_files = tuple(self.paths["SRC_DIR"] / name for name in REQUIRED_SOURCE_FILES)
+        self.optional_files = (self.paths["TASKS_FILE"],)
+        self.required_dirs = tuple(self.paths[key] for key in REQUIRED_DIR_KEYS)
+
+    @staticmethod
+    def _result(
+        message: str,
+        context: dict,
+        errors: list[str],
+        warnings: list[str],
+        fail_code: ExitCode = ExitCode.SYSTEM_ERROR,
+    ) -> OperationResult:
+        """Build a test result that succeeds exactly when no errors were recorded."""
+        ok = not errors
+        return OperationResult(
+            success=ok,
+            exit_code=ExitCode.SUCCESS if ok else fail_code,
+            message=message,
+            data=context,
+            errors=errors,
+            warnings=warnings,
+        )
 
     def log_result(self, result: OperationResult) -> None:
         """Log a validation result."""
-        self.results.append(result)
+        if self.keep_results:
+            self.results.append(result)
+        self._total += 1
+        self._passed += int(result.success)
+        self._total_errors += len(result.errors)
+        self._total_warnings += len(result.warnings)
         if not result.success:
             self.overall_success = False
 
@@ -104,49 +277,27 @@ class AutomationValidator:
         warnings: list[str] = []
         context: dict[str, str | bool] = {"validation_type": "module_imports"}
 
-        # Test critical imports
-        required_modules = [
-            "collections",
-            "datetime",
-            "enum",
-            "json",
-            "pathlib",
-            "re",
-            "shutil",
-            "subprocess",
-            "sys",
-            "os",
-        ]
-
-        for module_name in required_modules:
+        # Test critical imports: loaded modules cost a dict lookup, the rest are only
+        # located by the finders so their module code is never executed
+        for module_name in REQUIRED_MODULES:
+            if module_name in sys.modules:
+                continue
             try:
-                __import__(module_name)
-            except ImportError as e:
+                if importlib.util.find_spec(module_name) is None:
+                    errors.append(f"Required module '{module_name}' not available")
+            except (ImportError, ValueError) as e:
                 errors.append(f"Required module '{module_name}' not available: {e}")
 
-        # Test task_utils specific imports
+        # Test task_utils is resolvable without re-binding its names
         try:
-            from .task_utils import (
-                ID_RE,
-                METADATA_RE,
-                SUBTASK_RE,
-                TASK_BLOCK_RE,
-                format_task_block,
-                parse_existing_tasks,
-            )
-
-            context["task_utils_imports"] = "success"
+            if importlib.util.find_spec(".task_utils", __package__) is None:
+                errors.append("task_utils imports failed: module not found")
+            else:
+                context["task_utils_imports"] = "success"
         except ImportError as e:
             errors.append(f"task_utils imports failed: {e}")
 
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.SYSTEM_ERROR,
-            message="Module import validation completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
-        )
+        return self._result("Module import validation completed", context, errors, warnings)
 
     def validate_file_structure(self) -> OperationResult:
         """Validate that required files and directories exist."""
@@ -154,51 +305,45 @@ class AutomationValidator:
         warnings: list[str] = []
         context: dict[str, str | bool] = {"validation_type": "file_structure"}
 
-        # Check required files
-        required_files = [
-            self.paths["SRC_DIR"] / "task_utils.py",
-            self.paths["SRC_DIR"] / "run_tests.py",
-            self.paths["SRC_DIR"] / "create_change_entry.py",
-        ]
-
-        for file_path in required_files:
-            if not file_path.exists():
+        # Check required files; one stat() per path answers both "exists" and "what kind"
+        for file_path in self.required_files:
+            try:
+                mode = file_path.stat().st_mode
+            except OSError:
                 errors.append(f"Required file missing: {file_path}")
-            elif not file_path.is_file():
+                continue
+            if not stat.S_ISREG(mode):
                 errors.append(f"Path exists but is not a file: {file_path}")
             else:
                 context[f"found_{file_path.name}"] = True
 
         # Check optional files
-        optional_files = [self.paths["TASKS_FILE"]]
-        for file_path in optional_files:
-            if not file_path.exists():
+        for file_path in self.optional_files:
+            try:
+                file_path.stat()
+            except OSError:
                 warnings.append(f"Optional file missing: {file_path}")
             else:
                 context[f"found_{file_path.name}"] = True
 
         # Check required directories
-        required_dirs = [
-            self.paths["DOCS_DIR"],
-            self.paths["SRC_DIR"],
-            self.paths["PLANNING_DIR"],
-        ]
-
-        for dir_path in required_dirs:
-            if not dir_path.exists():
+        for dir_path in self.required_dirs:
+            try:
+                mode = dir_path.stat().st_mode
+            except OSError:
                 errors.append(f"Required directory missing: {dir_path}")
-            elif not dir_path.is_dir():
+                continue
+            if not stat.S_ISDIR(mode):
                 errors.append(f"Path exists but is not a directory: {dir_path}")
             else:
                 context[f"found_{dir_path.name}"] = True
 
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.VALIDATION_ERROR,
-            message="File structure validation completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
+        return self._result(
+            "File structure validation completed",
+            context,
+            errors,
+            warnings,
+            ExitCode.VALIDATION_ERROR,
         )
 
     def test_validation_functions(self) -> OperationResult:
@@ -207,25 +352,26 @@ class AutomationValidator:
         warnings: list[str] = []
         context: dict[str, str | int] = {"validation_type": "function_testing"}
 
-        # Test TaskInfo validation with good data
+        self._self_test_task_validation(errors, warnings, context)
+
+        # Test prerequisite validation
         try:
-            good_task = TaskInfo(
-                title="Test Task",
-                checked=False,
-                task_id=1,
-                priority="High",
-                assignee="TestUser",
-                create_date="2025-01-01T12:00:00Z",
-                start_date="2025-01-01T12:00:00Z",
-                finish_date=None,
-                estimated_time="30 minutes",
-                description="Test description",
-                prerequisites=["None"],
-                subtasks={"test_subtask": False},
-                raw_block="- [ ] **Test Task**:\n  - **ID**: 1",
-            )
+            prereq_result = validate_prerequisites(self.paths["ROOT"])
+            context["prerequisite_validation"] = "completed"
+            context["prereq_errors"] = len(prereq_result.errors)
+            context["prereq_warnings"] = len(prereq_result.warnings)
+        except Exception as e:
+            errors.append(f"Error testing prerequisite validation: {e}")
+
+        return self._result("Validation function testing completed", context, errors, warnings)
 
-            validation = validate_task_data(good_task)
+    def _self_test_task_validation(
+        self, errors: list[str], warnings: list[str], context: dict[str, str | int]
+    ) -> None:
+        """Run validate_task_data against known good and bad tasks."""
+        # Test TaskInfo validation with good data
+        try:
+            validation = validate_task_data(SELF_TEST_GOOD_TASK)
             if not validation.is_valid:
                 errors.append(f"Good task failed validation: {validation.errors}")
             else:
@@ -236,23 +382,7 @@ class AutomationValidator:
 
         # Test TaskInfo validation with bad data
         try:
-            bad_task = TaskInfo(
-                title="",  # Invalid: empty title
-                checked=False,
-                task_id=-1,  # Invalid: negative ID
-                priority="Invalid",  # Invalid: not in allowed priorities
-                assignee="TestUser",
-                create_date="invalid-date",  # Invalid: bad date format
-                start_date="2025-01-01T12:00:00Z",
-                finish_date=None,
-                estimated_time="30 minutes",
-                description="Test description",
-                prerequisites=["None"],
-                subtasks={},
-                raw_block="- [ ] **Bad Task**:\n  - **ID**: -1",
-            )
-
-            validation = validate_task_data(bad_task)
+            validation = validate_task_data(SELF_TEST_BAD_TASK)
             if validation.is_valid:
                 errors.append("Bad task passed validation when it should have failed")
             else:
@@ -265,31 +395,15 @@ class AutomationValidator:
         except Exception as e:
             errors.append(f"Error testing bad task validation: {e}")
 
-        # Test prerequisite validation
-        try:
-            prereq_result = validate_prerequisites(self.paths["ROOT"])
-            context["prerequisite_validation"] = "completed"
-            context["prereq_errors"] = len(prereq_result.errors)
-            context["prereq_warnings"] = len(prereq_result.warnings)
-        except Exception as e:
-            errors.append(f"Error testing prerequisite validation: {e}")
-
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.SYSTEM_ERROR,
-            message="Validation function testing completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
-        )
-
     def validate_existing_tasks(self) -> OperationResult:
         """Validate the existing tasks file if it exists."""
         errors: list[str] = []
         warnings: list[str] = []
         context: dict[str, str | bool | int | dict] = {"validation_type": "existing_tasks"}
 
-        if not self.paths["TASKS_FILE"].exists():
+        try:
+            tasks_stat = self.paths["TASKS_FILE"].stat()
+        except OSError:
             warnings.append(f"Tasks file does not exist: {self.paths['TASKS_FILE']}")
             context["tasks_file_exists"] = False
             return OperationResult(
@@ -303,44 +417,66 @@ class AutomationValidator:
 
         context["tasks_file_exists"] = True
 
+        # An unchanged tasks file gives the same outcome within this process
+        cache_key = (
+            str(self.paths["TASKS_FILE"].resolve()),
+            tasks_stat.st_mtime_ns,
+            tasks_stat.st_size,
+        )
+        cached = _TASKS_VALIDATION_CACHE.get(cache_key)
+        if cached is not None:
+            cached_context, cached_warnings = copy.deepcopy(cached)
+            context.update(cached_context)
+            warnings.extend(cached_warnings)
+            context["validation_cache"] = "hit"
+        else:
+            self._validate_tasks_content(errors, warnings, context)
+            if not errors:
+                _TASKS_VALIDATION_CACHE[cache_key] = copy.deepcopy((context, warnings))
+
+        return self._result(
+            "Existing tasks validation completed",
+            context,
+            errors,
+            warnings,
+            ExitCode.VALIDATION_ERROR,
+        )
+
+    def _validate_tasks_content(
+        self, errors: list[str], warnings: list[str], context: dict[str, str | bool | int | dict]
+    ) -> None:
+        """Validate the tasks file and summarize its task distribution."""
+        # Keep the tasks parsed during validation so the file is read and parsed once
+        tasks: dict[str, TaskInfo] = {}
+
+        def parse_and_keep(content: str) -> dict[str, TaskInfo]:
+            tasks.update(parse_existing_tasks(content))
+            return tasks
+
         try:
             # Use our validation function
-            validation = validate_tasks_file(self.paths["TASKS_FILE"], parse_existing_tasks)
+            validation = validate_tasks_file(self.paths["TASKS_FILE"], parse_and_keep)
             context.update(validation.context)
             errors.extend(validation.errors)
             warnings.extend(validation.warnings)
 
             if validation.is_valid:
                 context["validation_status"] = "passed"
-
-                # Try to load and parse tasks
-                try:
-                    content, tasks = load_tasks_file(self.paths["TASKS_FILE"], validate=True)
-                    context["task_count"] = len(tasks)
-                    context["parsing_status"] = "success"
-
-                    # Analyze task distribution
-                    priorities: dict[str, int] = {}
-                    assignees: dict[str, int] = {}
-                    completion_status = {"completed": 0, "in_progress": 0}
-
-                    for task in tasks.values():
-                        priorities[task.priority] = priorities.get(task.priority, 0) + 1
-                        assignee = task.assignee or "unassigned"
-                        assignees[assignee] = assignees.get(assignee, 0) + 1
-
-                        if task.checked:
-                            completion_status["completed"] += 1
-                        else:
-                            completion_status["in_progress"] += 1
-
-                    context["priority_distribution"] = priorities
-                    context["assignee_distribution"] = assignees
-                    context["completion_status"] = completion_status
-
-                except Exception as e:
-                    errors.append(f"Error loading tasks file: {e}")
-                    context["parsing_status"] = "failed"
+                context["task_count"] = len(tasks)
+                context["parsing_status"] = "success"
+
+                # Analyze task distribution; Counter and sum consume the
+                # attrgetter maps without a Python-level loop body
+                priorities = Counter(map(_get_priority, tasks.values()))
+                assignees = Counter(task.assignee or "unassigned" for task in tasks.values())
+                completed = sum(map(_get_checked, tasks.values()))
+
+                context["priority_distribution"] = dict(priorities)
+                context["assignee_distribution"] = dict(assignees)
+                context["completion_status"] = {
+                    "completed": completed,
+                    "in_progress": len(tasks) - completed,
+                }
             else:
                 context["validation_status"] = "failed"
 
@@ -348,15 +484,6 @@ class AutomationValidator:
             errors.append(f"Error validating tasks file: {e}")
             context["validation_status"] = "error"
 
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.VALIDATION_ERROR,
-            message="Existing tasks validation completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
-        )
-
     def test_git_integration(self) -> OperationResult:
         """Test git integration functions."""
         errors: list[str] = []
@@ -364,7 +491,17 @@ class AutomationValidator:
         context: dict[str, str | bool] = {"validation_type": "git_integration"}
 
         try:
-            git_info = get_git_info()
+            global _GIT_INFO_CACHE
+            if _GIT_INFO_CACHE is None:
+                git_info = get_git_info()
+                _GIT_INFO_CACHE = {key: git_info[key] for key in _CACHED_GIT_FIELDS}
+            else:
+                success, status, _ = run_git_command(["status", "--porcelain"])
+                git_info = {
+                    **_GIT_INFO_CACHE,
+                    "is_clean": success and len(status) == 0,
+                    "has_uncommitted": success and len(status) > 0,
+                }
             context.update(git_info)
 
             if git_info["branch"] == "unknown":
@@ -388,14 +525,7 @@ class AutomationValidator:
             errors.append(f"Error testing git integration: {e}")
             context["git_functional"] = False
 
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.SYSTEM_ERROR,
-            message="Git integration testing completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
-        )
+        return self._result("Git integration testing completed", context, errors, warnings)
 
     def test_output_formats(self) -> OperationResult:
         """Test JSON and human output formats."""
@@ -414,32 +544,19 @@ class AutomationValidator:
                 warnings=["test warning"],
             )
 
-            # Test JSON output (capture but don't print)
-            import io
-            from contextlib import redirect_stdout
-
-            json_output = io.StringIO()
-            with redirect_stdout(json_output):
-                output_result(test_result, "json", quiet=True)
-
-            json_content = json_output.getvalue()
+            # Test JSON output by rendering directly, without capturing stdout
+            json_content = serialize_result(test_result, "json")
             if not json_content.strip():
                 errors.append("JSON output is empty")
             else:
                 try:
-                    import json
-
                     json.loads(json_content)
                     context["json_format"] = "valid"
                 except json.JSONDecodeError as e:
                     errors.append(f"Invalid JSON output: {e}")
 
             # Test human output
-            human_output = io.StringIO()
-            with redirect_stdout(human_output):
-                output_result(test_result, "human", quiet=True)
-
-            human_content = human_output.getvalue()
+            human_content = serialize_result(test_result, "human")
             if not human_content.strip():
                 warnings.append("Human output is empty")
             else:
@@ -448,134 +565,107 @@ class AutomationValidator:
         except Exception as e:
             errors.append(f"Error testing output formats: {e}")
 
-        return OperationResult(
-            success=len(errors) == 0,
-            exit_code=ExitCode.SUCCESS if len(errors) == 0 else ExitCode.SYSTEM_ERROR,
-            message="Output format testing completed",
-            data=context,
-            errors=errors,
-            warnings=warnings,
-        )
+        return self._result("Output format testing completed", context, errors, warnings)
+
+    @functools.cached_property
+    def validation_time(self) -> str:
+        """Timestamp of this validation run, taken once and reused in its output."""
+        return get_current_datetime()
+
+    @functools.cached_property
+    def available_tests(self) -> dict[str, Callable[[], OperationResult]]:
+        """Validation tests keyed by name, bound to this validator."""
+        return {name: getattr(self, method) for name, _, method, _ in self._TESTS}
 
     def get_available_tests(self) -> dict[str, Callable[[], OperationResult]]:
         """Get dictionary of available validation tests."""
-        return {
-            "imports": self.validate_module_imports,
-            "structure": self.validate_file_structure,
-            "functions": self.test_validation_functions,
-            "tasks": self.validate_existing_tasks,
-            "git": self.test_git_integration,
-            "output": self.test_output_formats,
-        }
+        return self.available_tests
 
     def list_available_tests(self) -> None:
         """List available validation tests."""
-        tests = self.get_available_tests()
-
         if self.format_type == "json":
-            import json
-
             output = {
-                "available_tests": list(tests.keys()),
-                "descriptions": {
-                    "imports": "Validate that all required modules can be imported",
-                    "structure": "Validate that required files and directories exist",
-                    "functions": "Test validation functions with known good and bad data",
-                    "tasks": "Validate existing tasks file if it exists",
-                    "git": "Test git integration functions",
-                    "output": "Test JSON and human output formats",
-                },
+                "available_tests": list(self._TEST_DESCRIPTIONS),
+                "descriptions": dict(self._TEST_DESCRIPTIONS),
             }
-            print(json.dumps(output, indent=2))
+            if self.quiet:
+                print(json.dumps(output, separators=(",", ":")))
+            else:
+                print(json.dumps(output, indent=2))
         else:
             print("Available validation tests:")
-            print("  imports    - Validate that all required modules can be imported")
-            print("  structure  - Validate that required files and directories exist")
-            print("  functions  - Test validation functions with known good and bad data")
-            print("  tasks      - Validate existing tasks file if it exists")
-            print("  git        - Test git integration functions")
-            print("  output     - Test JSON and human output formats")
+            for name, description in self._TEST_DESCRIPTIONS.items():
+                print(f"  {name:<10} - {description}")
             print("\nUsage: --tests imports,git,structure")
 
-    def run_selective_validation(self, test_names: list[str]) -> OperationResult:
-        """Run only the specified validation tests."""
-        available_tests = self.get_available_tests()
-
-        # Validate test names
-        invalid_tests = [name for name in test_names if name not in available_tests]
-        if invalid_tests:
-            return create_structured_error(
-                f"Invalid test names: {', '.join(invalid_tests)}",
-                ExitCode.VALIDATION_ERROR,
-                [f"Available tests: {', '.join(available_tests.keys())}"],
-                {"invalid_tests": invalid_tests, "available_tests": list(available_tests.keys())},
-            )
-
-        if not self.quiet:
-            print(f"🔍 Starting selective automation validation ({', '.join(test_names)})...")
-            print(f"📅 Validation time: {get_current_datetime()}")
-            print(f"📁 Root directory: {self.paths['ROOT']}")
-            print("")
-
-        # Map test names to display names
-        test_display_names = {
-            "imports": "Module Imports",
-            "structure": "File Structure",
-            "functions": "Validation Functions",
-            "tasks": "Existing Tasks",
-            "git": "Git Integration",
-            "output": "Output Formats",
-        }
-
-        # Run selected validation tests
+    def _skip_tests(self, test_names: list[str]) -> None:
+        """Log the given tests as failed without running them after an import failure."""
+        # Every other test depends on the imports; running them only repeats the failure
         for test_name in test_names:
-            display_name = test_display_names.get(test_name, test_name.title())
-            test_func = available_tests[test_name]
+            self.skipped_tests.append(test_name)
+            self.log_result(
+                create_structured_error(
+                    f"{self._TEST_DISPLAY_NAMES[test_name]} validation skipped "
+                    "due to module import failure",
+                    ExitCode.SYSTEM_ERROR,
+                    ["Skipped due to module import failure"],
+                    {"test_name": test_name, "skipped": True},
+                )
+            )
 
+    def _run_tests(self, test_names: list[str]) -> None:
+        """Run the named validation tests in order, logging each result."""
+        for index, test_name in enumerate(test_names):
+            display_name = self._TEST_DISPLAY_NAMES[test_name]
             if not self.quiet:
                 print(f"🧪 Running {display_name} validation...")
 
             try:
-                result = test_func()
+                result = self.available_tests[test_name]()
                 self.log_result(result)
             except Exception as e:
-                error_result = create_structured_error(
-                    f"{display_name} validation failed with exception",
-                    ExitCode.SYSTEM_ERROR,
-                    [f"Exception: {e}", f"Traceback: {traceback.format_exc()}"],
-                    {"test_name": test_name},
-                )
-                self.log_result(error_result)
+                result = _exception_result(display_name, test_name, e)
+                self.log_result(result)
 
             if not self.quiet:
                 print("")
 
-        # Generate summary
-        total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r.success)
+            if test_name == "imports" and not result.success:
+                self._skip_tests(test_names[index + 1 :])
+                break
+
+    def _summarize(self, label: str, extra: dict[str, list[str]]) -> OperationResult:
+        """Build the overall result from the logged test results."""
+        total_tests = self._total
+        passed_tests = self._passed
         failed_tests = total_tests - passed_tests
 
-        total_errors = sum(len(r.errors) for r in self.results)
-        total_warnings = sum(len(r.warnings) for r in self.results)
+        total_errors = self._total_errors
+        total_warnings = self._total_warnings
 
         summary_data = {
-            "validation_time": get_current_datetime(),
-            "selected_tests": test_names,
+            "validation_time": self.validation_time,
+            **extra,
             "total_tests": total_tests,
             "passed_tests": passed_tests,
             "failed_tests": failed_tests,
             "total_errors": total_errors,
             "total_warnings": total_warnings,
+            "skipped_tests": self.skipped_tests,
             "overall_success": self.overall_success,
         }
 
         if self.overall_success:
-            message = f"✅ All {total_tests} selected validation tests passed"
+            message = f"All {total_tests} {label}tests passed"
             exit_code = ExitCode.SUCCESS
         else:
-            message = f"❌ {failed_tests}/{total_tests} selected validation tests failed"
+            message = f"{failed_tests}/{total_tests} {label}tests failed"
             exit_code = ExitCode.VALIDATION_ERROR
 
+        # Emoji markers are for people; JSON consumers get plain ASCII messages
+        if self.format_type != "json":
+            message = f"{'✅' if self.overall_success else '❌'} {message}"
+
         if total_warnings > 0:
             message += f" ({total_warnings} warnings)"
 
@@ -588,83 +678,44 @@ class AutomationValidator:
             warnings=[],
         )
 
+    def run_selective_validation(self, test_names: list[str]) -> OperationResult:
+        """Run only the specified validation tests."""
+        # Validate test names
+        invalid_tests = [name for name in test_names if name not in self._TEST_NAMES]
+        if invalid_tests:
+            available_tests = list(self._TEST_DISPLAY_NAMES)
+            return create_structured_error(
+                f"Invalid test names: {', '.join(invalid_tests)}",
+                ExitCode.VALIDATION_ERROR,
+                [f"Available tests: {', '.join(available_tests)}"],
+                {"invalid_tests": invalid_tests, "available_tests": available_tests},
+            )
+
+        if not self.quiet:
+            print(f"🔍 Starting selective automation validation ({', '.join(test_names)})...")
+            print(f"📅 Validation time: {self.validation_time}")
+            print(f"📁 Root directory: {self.paths['ROOT']}")
+            print("")
+
+        self._run_tests(test_names)
+        return self._summarize("selected validation ", {"selected_tests": test_names})
+
     def run_comprehensive_validation(self) -> OperationResult:
         """Run all validation tests and return overall result."""
         if not self.quiet:
             print("🔍 Starting comprehensive automation validation...")
-            print(f"📅 Validation time: {get_current_datetime()}")
+            print(f"📅 Validation time: {self.validation_time}")
             print(f"📁 Root directory: {self.paths['ROOT']}")
             print("")
 
-        # Run all validation tests
-        validation_tests = [
-            ("Module Imports", self.validate_module_imports),
-            ("File Structure", self.validate_file_structure),
-            ("Validation Functions", self.test_validation_functions),
-            ("Existing Tasks", self.validate_existing_tasks),
-            ("Git Integration", self.test_git_integration),
-            ("Output Formats", self.test_output_formats),
-        ]
-
-        for test_name, test_func in validation_tests:
-            if not self.quiet:
-                print(f"🧪 Running {test_name} validation...")
-
-            try:
-                result = test_func()
-                self.log_result(result)
-            except Exception as e:
-                error_result = create_structured_error(
-                    f"{test_name} validation failed with exception",
-                    ExitCode.SYSTEM_ERROR,
-                    [f"Exception: {e}", f"Traceback: {traceback.format_exc()}"],
-                    {"test_name": test_name},
-                )
-                self.log_result(error_result)
-
-            if not self.quiet:
-                print("")
-
-        # Generate summary
-        total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r.success)
-        failed_tests = total_tests - passed_tests
-
-        total_errors = sum(len(r.errors) for r in self.results)
-        total_warnings = sum(len(r.warnings) for r in self.results)
-
-        summary_data = {
-            "validation_time": get_current_datetime(),
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": failed_tests,
-            "total_errors": total_errors,
-            "total_warnings": total_warnings,
-            "overall_success": self.overall_success,
-        }
-
-        if self.overall_success:
-            message = f"✅ All {total_tests} validation tests passed"
-            exit_code = ExitCode.SUCCESS
-        else:
-            message = f"❌ {failed_tests}/{total_tests} validation tests failed"
-            exit_code = ExitCode.VALIDATION_ERROR
+        self._run_tests(list(self.available_tests))
+        return self._summarize("validation ", {})
 
-        if total_warnings > 0:
-            message += f" ({total_warnings} warnings)"
 
-        return OperationResult(
-            success=self.overall_success,
-            exit_code=exit_code,
-            message=message,
-            data=summary_data,
-            errors=[],
-            warnings=[],
-        )
+def _build_parser():
+    """Build the command-line parser for the validation script."""
+    import argparse
 
-
-def main(argv=None, root_override=None):
-    """Main entry point for validation script."""
     parser = argparse.ArgumentParser(
         description="Validate task automation system components",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -709,21 +760,38 @@ Examples:
         help="List available validation tests and exit",
     )
 
-    args = parser.parse_args(argv)
+    return parser
+
+
+def main(argv=None, root_override=None) -> int:
+    """Main entry point for validation script; returns the process exit code."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Listing the tests needs no option parsing, so skip building the parser
+    if argv == ["--list-tests"]:
+        AutomationValidator(root_override=root_override).list_available_tests()
+        return 0
+
+    args = _build_parser().parse_args(argv)
 
-    # Create validator
+    # Create validator; the CLI only reports the summary, so results are not retained
     validator = AutomationValidator(
-        quiet=args.quiet, format_type=args.format, root_override=root_override
+        quiet=args.quiet,
+        format_type=args.format,
+        root_override=root_override,
+        keep_results=False,
     )
 
     # Handle list-tests option
     if args.list_tests:
         validator.list_available_tests()
-        sys.exit(0)
+        return 0
 
     # Run validation (selective or comprehensive)
     if args.tests:
-        result = validator.run_selective_validation(args.tests.split(","))
+        test_names = [name.strip() for name in args.tests.split(",") if name.strip()]
+        result = validator.run_selective_validation(test_names)
     else:
         result = validator.run_comprehensive_validation()
 
@@ -731,9 +799,8 @@ Examples:
     if not args.quiet or args.format == "json":
         output_result(result, args.format, args.quiet)
 
-    # Exit with appropriate code
-    sys.exit(result.exit_code.value)
+    return result.exit_code.value
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
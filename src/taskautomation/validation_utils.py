@@ -8,15 +8,20 @@ file operations, and system prerequisites.
 
 from __future__ import annotations
 
-import collections
 import datetime
+import functools
 import os
 import pathlib
+import re
+import stat
 import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from .core_utils import DATETIME_RE, TaskInfo
-from .git_helpers import get_git_info, run_git_command
+from .file_operations import _parent_state
+from .git_helpers import run_git_command
 from .task_types import ValidationResult
 
 # Export list for backward compatibility
@@ -29,6 +34,7 @@ __all__ = [
     "extract_create_date",
     "extract_description",
     "extract_finished_date",
+    "extract_task_fields",
     "extract_task_id",
     "extract_priority",
     "is_valid_task_line",
@@ -36,10 +42,74 @@ __all__ = [
     "validate_task_schema",
 ]
 
+# Patterns for the backward-compatible task line helpers, compiled once
+# Checklist ("- [ ]") or numbered ("1. ") start of a stripped line, as one alternation
+_TASK_LINE_START_RE = re.compile(r"[-*+]\s*\[[\sx]\]|\d+\.\s")
+_LINE_ID_RE = re.compile(r"(T-\d+|ID:\s*\w+)")
+_TASK_LINE_INDICATORS = ("todo:", "task:", "action:", "do:", "- [ ]", "- [x]")
+
+# One scan for every extract_* field. Each alternative sits inside a zero-width
+# lookahead so no match consumes text another field needs; at most one alternative
+# can match at any position. The leading character class lets the scan skip
+# positions that cannot start any field; it includes the dotted and dotless i,
+# which IGNORECASE equates with "i".
+_TASK_FIELDS_RE = re.compile(
+    r"(?=[@\[ACFIPTacfip\u0130\u0131])"
+    r"(?="
+    r"(?i:Assignee:\s*(?P<assignee>[^\n]+))"
+    r"|@(?P<at_user>[a-zA-Z0-9_-]+)"
+    r"|(?i:Create\s+Date:\s*(?P<create_date>[^\n]+))"
+    r"|(?i:Created:\s*(?P<created>[^\n]+))"
+    r"|(?i:Finished\s+Date:\s*(?P<finished_date>[^\n]+))"
+    r"|(?i:Completed:\s*(?P<completed>[^\n]+))"
+    r"|(?i:Finished:\s*(?P<finished>[^\n]+))"
+    r"|(?i:ID:\s*(?P<id_field>[^\n\s]+))"
+    r"|\[(?P<bracket_id>[A-Z]+-\d+)\]"
+    r"|(?P<t_id>T-\d+)"
+    r"|(?i:Priority:\s*(?P<priority>[^\n]+))"
+    r"|\[(?P<bracket_priority>[A-Z]+)\]"
+    r")"
+)
+_HEADING_MARKER_RE = re.compile(r"^#+\s*")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.*?)\*")
+
+# Priority words recognised by extract_priority, lower-cased -> canonical spelling
+_PRIORITY_CANON: Mapping[str, str] = MappingProxyType(
+    {word: word.title() for word in ("high", "medium", "low", "critical", "urgent")}
+)
+
+
+def _looks_like_iso_date(value: str) -> bool:
+    r"""
+    Check whether a string starts with a YYYY-MM-DD date.
+
+    Equivalent to ``re.match(r"\d{4}-\d{2}-\d{2}", value)`` (isdecimal() is the
+    same digit class as ``\d``) without entering the regex engine.
+    """
+    return (
+        len(value) >= 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[0:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    )
+
+
 # =============================================================================
 # Task Validation Functions
 # =============================================================================
 
+# Priority names accepted by validate_task_data and validate_task_schema
+VALID_PRIORITIES = frozenset({"Critical", "High", "Medium", "Low"})
+
+# Status names suggested by validate_task_schema
+VALID_SCHEMA_STATUSES = frozenset({"todo", "in_progress", "done", "cancelled"})
+
+# Task fields holding ISO8601 datetimes
+DATE_FIELDS = ("create_date", "start_date", "finish_date")
+
 
 def validate_task_data(task: TaskInfo) -> ValidationResult:
     """
@@ -51,68 +121,109 @@ def validate_task_data(task: TaskInfo) -> ValidationResult:
     Returns:
         ValidationResult with detailed validation information
     """
+    subtask_count = len(task.subtasks)
+    is_valid, errors, warnings = _check_task_fields(
+        task.title,
+        task.task_id,
+        task.priority,
+        task.create_date,
+        task.start_date,
+        task.finish_date,
+        task.checked,
+        subtask_count,
+        all(task.subtasks.values()),
+    )
+
+    context = {
+        "task_id": task.task_id,
+        "title": task.title,
+        "priority": task.priority,
+        "has_subtasks": subtask_count > 0,
+        "subtask_count": subtask_count,
+        "completion_status": "completed" if task.checked else "in_progress",
+    }
+
+    # Hand out fresh lists so callers cannot mutate the memoized result
+    return ValidationResult(
+        is_valid=is_valid, errors=list(errors), warnings=list(warnings), context=context
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_task_datetime(value: str) -> datetime.datetime:
+    """
+    Parse a task timestamp, ignoring a trailing Z.
+
+    Memoized because many tasks share the same create and start timestamps.
+    Invalid values raise ValueError and are not cached.
+    """
+    return datetime.datetime.fromisoformat(value.rstrip("Z"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_task_fields(
+    title: str,
+    task_id: int,
+    priority: str,
+    create_date: str | None,
+    start_date: str | None,
+    finish_date: str | None,
+    checked: bool,
+    subtask_count: int,
+    all_subtasks_done: bool,
+) -> tuple[bool, tuple[str, ...], tuple[str, ...]]:
+    """
+    Check the fields of a task that determine its validation messages.
+
+    Memoized on the field values so re-validating unchanged tasks (e.g. on
+    every file reload) skips the regex and datetime work.
+
+    Returns:
+        Tuple of (is_valid, errors, warnings)
+    """
     errors = []
     warnings = []
-    context = {"task_id": task.task_id, "title": task.title}
 
     # Validate required fields
-    if not task.title or not task.title.strip():
+    if not title or not title.strip():
         errors.append("Task title is required and cannot be empty")
 
-    if task.task_id <= 0:
-        errors.append(f"Task ID must be a positive integer, got: {task.task_id}")
+    if task_id <= 0:
+        errors.append(f"Task ID must be a positive integer, got: {task_id}")
 
     # Validate priority
-    valid_priorities = {"Critical", "High", "Medium", "Low"}
-    if task.priority not in valid_priorities:
-        errors.append(f"Priority must be one of {valid_priorities}, got: {task.priority}")
+    if priority not in VALID_PRIORITIES:
+        errors.append(f"Priority must be one of {sorted(VALID_PRIORITIES)}, got: {priority}")
 
     # Validate dates
-    for date_field, date_value in [
-        ("create_date", task.create_date),
-        ("start_date", task.start_date),
-        ("finish_date", task.finish_date),
-    ]:
+    dates = (create_date, start_date, finish_date)
+    for date_field, date_value in zip(DATE_FIELDS, dates, strict=True):
         if date_value and not DATETIME_RE.match(date_value):
             errors.append(f"{date_field} must be in ISO8601 format, got: {date_value}")
 
     # Validate date logic
-    if task.create_date and task.start_date:
+    if create_date and start_date:
         try:
-            create_dt = datetime.datetime.fromisoformat(task.create_date.rstrip("Z"))
-            start_dt = datetime.datetime.fromisoformat(task.start_date.rstrip("Z"))
-            if start_dt < create_dt:
+            if _parse_task_datetime(start_date) < _parse_task_datetime(create_date):
                 warnings.append("Start date is before create date")
         except ValueError as e:
             errors.append(f"Date parsing error: {e}")
 
     # Validate completion logic
-    if task.checked and not task.finish_date:
+    if checked and not finish_date:
         warnings.append("Completed task should have a finish date")
 
-    if not task.checked and task.finish_date:
+    if not checked and finish_date:
         warnings.append("Incomplete task should not have a finish date")
 
     # Validate subtasks
-    if task.subtasks:
-        all_subtasks_done = all(task.subtasks.values())
-        if task.checked and not all_subtasks_done:
+    if subtask_count:
+        if checked and not all_subtasks_done:
             warnings.append("Main task is completed but some subtasks are not")
-        elif not task.checked and all_subtasks_done:
+        elif not checked and all_subtasks_done:
             warnings.append("All subtasks completed but main task is not")
 
-    context.update(
-        {
-            "priority": task.priority,
-            "has_subtasks": bool(task.subtasks),
-            "subtask_count": len(task.subtasks),
-            "completion_status": "completed" if task.checked else "in_progress",
-        }
-    )
-
-    return ValidationResult(
-        is_valid=len(errors) == 0, errors=errors, warnings=warnings, context=context
-    )
+    return len(errors) == 0, tuple(errors), tuple(warnings)
 
 
 def validate_tasks_file(file_path: pathlib.Path, parse_tasks_func) -> ValidationResult:
@@ -130,15 +241,17 @@ def validate_tasks_file(file_path: pathlib.Path, parse_tasks_func) -> Validation
     warnings: list[str] = []
     context: dict[str, Any] = {"file_path": str(file_path)}
 
-    # Check file existence
-    if not file_path.exists():
-        errors.append(f"Tasks file does not exist: {file_path}")
-        return ValidationResult(False, errors, warnings, context)
-
+    # Read once; a missing file is reported by the read itself rather than a prior stat()
     try:
         content = file_path.read_text(encoding="utf-8")
         context["file_size"] = len(content)
-        context["line_count"] = len(content.split("\n"))
+        # Count lines without splitting; a trailing newline does not start a new line
+        context["line_count"] = content.count("\n") + (
+            1 if content and not content.endswith("\n") else 0
+        )
+    except FileNotFoundError:
+        errors.append(f"Tasks file does not exist: {file_path}")
+        return ValidationResult(False, errors, warnings, context)
     except Exception as e:
         errors.append(f"Cannot read tasks file: {e}")
         return ValidationResult(False, errors, warnings, context)
@@ -148,22 +261,27 @@ def validate_tasks_file(file_path: pathlib.Path, parse_tasks_func) -> Validation
         tasks = parse_tasks_func(content)
         context["task_count"] = len(tasks)
 
-        # Check for duplicate IDs
-        task_ids = [task.task_id for task in tasks.values()]
-        duplicates = [tid for tid, count in collections.Counter(task_ids).items() if count > 1]
-        if duplicates:
-            errors.append(f"Duplicate task IDs found: {duplicates}")
-
-        # Validate each task
-        task_errors = []
-        task_warnings = []
+        # Validate each task and collect duplicate IDs in the same pass; each
+        # repeated ID is reported once. Clean tasks skip message formatting entirely.
+        # The loop stays sequential: per-task checks are memoized and cost a few
+        # microseconds, far less than pickling tasks out to a worker pool.
+        seen_ids: set[int] = set()
+        duplicate_ids: dict[int, None] = {}
         for task in tasks.values():
+            if task.task_id in seen_ids:
+                duplicate_ids[task.task_id] = None
+            else:
+                seen_ids.add(task.task_id)
+
             result = validate_task_data(task)
-            task_errors.extend([f"Task {task.task_id}: {err}" for err in result.errors])
-            task_warnings.extend([f"Task {task.task_id}: {warn}" for warn in result.warnings])
+            if result.errors or result.warnings:
+                prefix = f"Task {task.task_id}: "
+                errors.extend(prefix + err for err in result.errors)
+                warnings.extend(prefix + warn for warn in result.warnings)
 
-        errors.extend(task_errors)
-        warnings.extend(task_warnings)
+        # The duplicate summary leads the per-task errors
+        if duplicate_ids:
+            errors.insert(0, f"Duplicate task IDs found: {list(duplicate_ids)}")
 
     except Exception as e:
         errors.append(f"Error parsing tasks: {e}")
@@ -179,7 +297,10 @@ def validate_tasks_file(file_path: pathlib.Path, parse_tasks_func) -> Validation
 
 
 def verify_operation_safety(
-    operation: str, target_files: list[pathlib.Path], dry_run: bool = True
+    operation: str,
+    target_files: list[pathlib.Path],
+    dry_run: bool = True,
+    git_info: dict[str, Any] | None = None,
 ) -> ValidationResult:
     """
     Verify that an operation is safe to perform.
@@ -188,6 +309,8 @@ def verify_operation_safety(
         operation: Description of operation
         target_files: Files that will be affected
         dry_run: Whether this is a dry run
+        git_info: Result of get_git_info() to reuse across calls; when omitted only
+            the working tree status is queried
 
     Returns:
         ValidationResult with safety assessment
@@ -200,24 +323,35 @@ def verify_operation_safety(
         "dry_run": dry_run,
     }
 
-    # Check file permissions
+    # Check file permissions; sibling targets share one parent directory lookup
+    parent_states: dict[pathlib.Path, str] = {}
     for file_path in target_files:
-        if file_path.exists():
-            if not file_path.is_file():
+        # One stat() answers both "exists" and "is a regular file"
+        try:
+            mode: int | None = file_path.stat().st_mode
+        except OSError:
+            mode = None
+        if mode is not None:
+            if not stat.S_ISREG(mode):
                 errors.append(f"Target is not a file: {file_path}")
             elif not os.access(file_path, os.W_OK):
                 errors.append(f"No write permission: {file_path}")
         else:
             # Check parent directory permissions
             parent = file_path.parent
-            if not parent.exists():
+            state = _parent_state(parent, parent_states)
+            if state == "missing":
                 warnings.append(f"Parent directory will be created: {parent}")
-            elif not os.access(parent, os.W_OK):
+            elif state == "readonly":
                 errors.append(f"No write permission for parent directory: {parent}")
 
-    # Git repository checks
-    git_info = get_git_info()
-    if git_info["has_uncommitted"]:
+    # Git repository checks; only the working tree status is needed here
+    if git_info is not None:
+        has_uncommitted = git_info["has_uncommitted"]
+    else:
+        success, status, _ = run_git_command(["status", "--porcelain"])
+        has_uncommitted = success and len(status) > 0
+    if has_uncommitted:
         warnings.append("Working directory has uncommitted changes")
 
     return ValidationResult(
@@ -230,6 +364,18 @@ def verify_operation_safety(
 # =============================================================================
 
 
+@functools.cache
+def _git_available() -> bool:
+    """
+    Check once per process whether the git executable runs.
+
+    Returns:
+        True if ``git --version`` succeeds
+    """
+    success, _, _ = run_git_command(["--version"])
+    return success
+
+
 def validate_prerequisites(root_path: pathlib.Path) -> ValidationResult:
     """
     Validate that all prerequisites for task operations are met.
@@ -253,21 +399,23 @@ def validate_prerequisites(root_path: pathlib.Path) -> ValidationResult:
     if python_version < (3, 8):
         errors.append(f"Python 3.8+ required, found {context['python_version']}")
 
-    # Check required directories
-    required_dirs = [root_path / "docs", root_path / "scripts" / "dev"]
-    for dir_path in required_dirs:
-        if not dir_path.exists():
+    # Check required directories; os.path.exists skips pathlib's wrapper layer
+    for dir_path in (root_path / "docs", root_path / "scripts" / "dev"):
+        if not os.path.exists(dir_path):
             errors.append(f"Required directory missing: {dir_path}")
 
     # Check git availability
-    git_available, _, _ = run_git_command(["--version"])
+    git_available = _git_available()
     context["git_available"] = git_available
     if not git_available:
         warnings.append("Git not available - some features may not work")
 
-    # Check if we're in a git repository
+    # Check if we're in a git repository. A .git directory (or the gitdir file of a
+    # worktree/submodule) answers this without spawning git.
     if git_available:
-        is_repo, _, _ = run_git_command(["rev-parse", "--git-dir"])
+        is_repo = os.path.exists(root_path / ".git")
+        if not is_repo:
+            is_repo, _, _ = run_git_command(["rev-parse", "--git-dir"])
         context["is_git_repo"] = is_repo
         if not is_repo:
             warnings.append("Not in a git repository - some features may not work")
@@ -277,6 +425,65 @@ def validate_prerequisites(root_path: pathlib.Path) -> ValidationResult:
     )
 
 
+def _first_date(found: Mapping[str, str], *keys: str) -> str:
+    """Return the first ISO date among the scanned fields named by keys, or ""."""
+    for key in keys:
+        if key in found:
+            date_str = found[key].strip()
+            if _looks_like_iso_date(date_str):
+                return date_str
+    return ""
+
+
+def _first_priority(found: Mapping[str, str], *keys: str) -> str:
+    """Return the first known priority among the scanned fields named by keys, or ""."""
+    for key in keys:
+        if key in found:
+            canonical = _PRIORITY_CANON.get(found[key].strip().lower())
+            if canonical:
+                return canonical
+    return ""
+
+
+@functools.lru_cache(maxsize=2048)
+def _scan_task_fields(task_content: str) -> Mapping[str, str]:
+    """
+    Scan task content once for the task_id, priority, assignee and date fields.
+
+    Every extract_* function except extract_description reads its field from
+    this one memoized scan, so querying several fields of the same task body
+    costs a single regex pass.
+
+    Returns:
+        Read-only mapping of field name -> extracted value ("" when absent)
+    """
+    # Only the first occurrence of each pattern counts; a missing or invalid field
+    # falls back to the next pattern for it (e.g. Priority: -> [HIGH])
+    found: dict[str, str] = {}
+    for match in _TASK_FIELDS_RE.finditer(task_content):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+
+    if "assignee" in found:
+        assignee = found["assignee"].strip()
+    else:
+        assignee = found.get("at_user", "")
+
+    if "id_field" in found:
+        task_id = found["id_field"].strip()
+    else:
+        task_id = found.get("bracket_id") or found.get("t_id", "")
+
+    return MappingProxyType(
+        {
+            "task_id": task_id,
+            "priority": _first_priority(found, "priority", "bracket_priority"),
+            "assignee": assignee,
+            "create_date": _first_date(found, "create_date", "created"),
+            "finished_date": _first_date(found, "finished_date", "completed", "finished"),
+        }
+    )
+
+
 def extract_assignee(task_content: str) -> str:
     """
     Extract assignee information from task content.
@@ -291,19 +498,10 @@ def extract_assignee(task_content: str) -> str:
         This is a basic implementation for backward compatibility.
         Looks for patterns like "Assignee: name" or "@username"
     """
-    import re
-
-    # Look for "Assignee: name" pattern
-    assignee_match = re.search(r"Assignee:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if assignee_match:
-        return assignee_match.group(1).strip()
-
-    # Look for @username pattern
-    at_match = re.search(r"@([a-zA-Z0-9_-]+)", task_content)
-    if at_match:
-        return at_match.group(1)
+    if not isinstance(task_content, str):
+        return ""
 
-    return ""
+    return _scan_task_fields(task_content)["assignee"]
 
 
 def extract_create_date(task_content: str) -> str:
@@ -320,24 +518,10 @@ def extract_create_date(task_content: str) -> str:
         This is a basic implementation for backward compatibility.
         Looks for patterns like "Create Date: YYYY-MM-DD" or similar.
     """
-    import re
-
-    # Look for "Create Date: date" pattern
-    create_date_match = re.search(r"Create\s+Date:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if create_date_match:
-        date_str = create_date_match.group(1).strip()
-        # Basic validation - should match ISO8601-like format
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-            return date_str
-
-    # Look for "Created: date" pattern
-    created_match = re.search(r"Created:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if created_match:
-        date_str = created_match.group(1).strip()
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-            return date_str
+    if not isinstance(task_content, str):
+        return ""
 
-    return ""
+    return _scan_task_fields(task_content)["create_date"]
 
 
 def extract_description(task_content: str) -> str:
@@ -350,19 +534,27 @@ def extract_description(task_content: str) -> str:
     Returns:
         str: Extracted description or empty string if not found
     """
-    if not task_content or not isinstance(task_content, str):
+    if not isinstance(task_content, str) or not task_content:
         return ""
 
+    return _strip_markdown(task_content)
+
+
+@functools.lru_cache(maxsize=2048)
+def _strip_markdown(task_content: str) -> str:
+    """
+    Strip surrounding whitespace and heading, bold and italic markers.
+
+    Memoized because the same task body is re-read on every reload.
+    """
     # Remove leading/trailing whitespace and return as description
     description = task_content.strip()
 
     # Remove any markdown formatting for basic description
     # This is a simple implementation - could be enhanced for more complex parsing
-    import re
-
-    description = re.sub(r"^#+\s*", "", description)  # Remove heading markers
-    description = re.sub(r"\*\*(.*?)\*\*", r"\1", description)  # Remove bold
-    description = re.sub(r"\*(.*?)\*", r"\1", description)  # Remove italic
+    description = _HEADING_MARKER_RE.sub("", description)  # Remove heading markers
+    description = _BOLD_RE.sub(r"\1", description)  # Remove bold
+    description = _ITALIC_RE.sub(r"\1", description)  # Remove italic
 
     return description
 
@@ -381,31 +573,10 @@ def extract_finished_date(task_content: str) -> str:
         This is a basic implementation for backward compatibility.
         Looks for patterns like "Finished Date: YYYY-MM-DD" or similar.
     """
-    import re
-
-    # Look for "Finished Date: date" pattern
-    finished_date_match = re.search(r"Finished\s+Date:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if finished_date_match:
-        date_str = finished_date_match.group(1).strip()
-        # Basic validation - should match ISO8601-like format
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-            return date_str
-
-    # Look for "Completed: date" pattern
-    completed_match = re.search(r"Completed:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if completed_match:
-        date_str = completed_match.group(1).strip()
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-            return date_str
-
-    # Look for "Finished: date" pattern
-    finished_match = re.search(r"Finished:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if finished_match:
-        date_str = finished_match.group(1).strip()
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
-            return date_str
+    if not isinstance(task_content, str):
+        return ""
 
-    return ""
+    return _scan_task_fields(task_content)["finished_date"]
 
 
 def extract_task_id(task_content: str) -> str:
@@ -422,29 +593,10 @@ def extract_task_id(task_content: str) -> str:
         This is a basic implementation for backward compatibility.
         Looks for patterns like "ID: T-123" or similar.
     """
-    import re
-
-    # Look for "ID: identifier" pattern
-    id_match = re.search(r"ID:\s*([^\n\s]+)", task_content, re.IGNORECASE)
-    if id_match:
-        return id_match.group(1).strip()
-
-    # Look for "Task ID: identifier" pattern
-    task_id_match = re.search(r"Task\s+ID:\s*([^\n\s]+)", task_content, re.IGNORECASE)
-    if task_id_match:
-        return task_id_match.group(1).strip()
-
-    # Look for bracketed ID like [T-123]
-    bracket_match = re.search(r"\[([A-Z]+-\d+)\]", task_content)
-    if bracket_match:
-        return bracket_match.group(1)
+    if not isinstance(task_content, str):
+        return ""
 
-    # Look for T-### pattern
-    t_pattern_match = re.search(r"(T-\d+)", task_content)
-    if t_pattern_match:
-        return t_pattern_match.group(1)
-
-    return ""
+    return _scan_task_fields(task_content)["task_id"]
 
 
 def is_valid_task_line(line: str) -> bool:
@@ -461,29 +613,26 @@ def is_valid_task_line(line: str) -> bool:
         This is a basic implementation for backward compatibility.
         Checks for common task line patterns.
     """
-    import re
-
     if not line or not isinstance(line, str):
         return False
 
     line = line.strip()
+    if not line:
+        return False
 
-    # Check for markdown checklist format
-    if re.match(r"^[\s]*[-*+]\s*\[[\sx]\]", line):
+    # Check for markdown checklist and numbered task formats in one match; the
+    # first character rules the regex out for most lines
+    first = line[0]
+    if (first in "-*+" or first.isdigit()) and _TASK_LINE_START_RE.match(line):
         return True
 
-    # Check for numbered task format
-    if re.match(r"^[\s]*\d+\.\s+", line):
+    # Check for basic task indicators anywhere in the line
+    lowered = line.lower()
+    if any(indicator in lowered for indicator in _TASK_LINE_INDICATORS):
         return True
 
-    # Check for basic task indicators
-    task_indicators = ["TODO:", "TASK:", "Action:", "Do:", "- [ ]", "- [x]"]
-    for indicator in task_indicators:
-        if indicator.lower() in line.lower():
-            return True
-
-    # Check for task ID patterns
-    if re.search(r"(T-\d+|ID:\s*\w+)", line):
+    # Check for task ID patterns; both alternatives need a literal "T-" or "ID:"
+    if ("T-" in line or "ID:" in line) and _LINE_ID_RE.search(line):
         return True
 
     return False
@@ -503,26 +652,27 @@ def extract_priority(task_content: str) -> str:
         This is a basic implementation for backward compatibility.
         Looks for patterns like "Priority: High" or similar.
     """
-    import re
-
-    # Look for "Priority: level" pattern
-    priority_match = re.search(r"Priority:\s*([^\n]+)", task_content, re.IGNORECASE)
-    if priority_match:
-        priority_str = priority_match.group(1).strip()
-        # Normalize common priority values
-        priority_lower = priority_str.lower()
-        if priority_lower in ["high", "medium", "low", "critical", "urgent"]:
-            return priority_str.title()  # Return with proper capitalization
-
-    # Look for bracketed priority like [HIGH], [MEDIUM], [LOW]
-    bracket_match = re.search(r"\[([A-Z]+)\]", task_content)
-    if bracket_match:
-        priority_str = bracket_match.group(1)
-        priority_lower = priority_str.lower()
-        if priority_lower in ["high", "medium", "low", "critical", "urgent"]:
-            return priority_str.title()
+    if not isinstance(task_content, str):
+        return ""
 
-    return ""
+    return _scan_task_fields(task_content)["priority"]
+
+
+def extract_task_fields(task_content: str) -> dict[str, str]:
+    """
+    Extract every extract_* field from task content in a single scan.
+
+    Args:
+        task_content: The task content to extract fields from
+
+    Returns:
+        Dictionary with task_id, priority, assignee, create_date, finished_date
+        and description, each equal to what the matching extract_* function returns
+    """
+    if not isinstance(task_content, str):
+        # Every field is empty, as each extract_* function returns for non-str input
+        task_content = ""
+    return {**_scan_task_fields(task_content), "description": extract_description(task_content)}
 
 
 def validate_task_format(task_line: str) -> bool:
@@ -563,15 +713,15 @@ def validate_task_schema(task_data: dict) -> ValidationResult:
     """
     errors = []
     warnings = []
-    context = {"validation_type": "schema", "task_data_keys": list(task_data.keys())}
 
     if not isinstance(task_data, dict):
         errors.append("Task data must be a dictionary")
-        return ValidationResult(False, errors, warnings, context)
+        return ValidationResult(False, errors, warnings, {"validation_type": "schema"})
+
+    context = {"validation_type": "schema", "task_data_keys": list(task_data.keys())}
 
     # Check for required fields
-    required_fields = ["title", "task_id"]
-    for field in required_fields:
+    for field in ("title", "task_id"):
         if field not in task_data:
             errors.append(f"Required field missing: {field}")
         elif not task_data[field]:
@@ -579,31 +729,25 @@ def validate_task_schema(task_data: dict) -> ValidationResult:
 
     # Validate task_id is numeric if present
     if "task_id" in task_data:
+        task_id = task_data["task_id"]
         try:
-            task_id = int(task_data["task_id"])
-            if task_id <= 0:
+            if (task_id if isinstance(task_id, int) else int(task_id)) <= 0:
                 errors.append("Task ID must be a positive integer")
         except (ValueError, TypeError):
             errors.append("Task ID must be numeric")
 
     # Validate priority if present
-    if "priority" in task_data:
-        valid_priorities = {"Critical", "High", "Medium", "Low"}
-        if task_data["priority"] not in valid_priorities:
-            errors.append(f"Priority must be one of {valid_priorities}")
+    if "priority" in task_data and task_data["priority"] not in VALID_PRIORITIES:
+        errors.append(f"Priority must be one of {sorted(VALID_PRIORITIES)}")
 
     # Validate status if present
-    if "status" in task_data:
-        valid_statuses = {"todo", "in_progress", "done", "cancelled"}
-        if task_data["status"] not in valid_statuses:
-            warnings.append(f"Status should be one of {valid_statuses}")
+    if "status" in task_data and task_data["status"] not in VALID_SCHEMA_STATUSES:
+        warnings.append(f"Status should be one of {sorted(VALID_SCHEMA_STATUSES)}")
 
     # Validate date fields if present
-    date_fields = ["create_date", "start_date", "finish_date"]
-    for field in date_fields:
-        if field in task_data and task_data[field]:
-            if not DATETIME_RE.match(task_data[field]):
-                errors.append(f"{field} must be in ISO8601 format")
+    for field in DATE_FIELDS:
+        if task_data.get(field) and not DATETIME_RE.match(task_data[field]):
+            errors.append(f"{field} must be in ISO8601 format")
 
     return ValidationResult(
         is_valid=len(errors) == 0, errors=errors, warnings=warnings, context=context
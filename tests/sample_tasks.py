@@ -0,0 +1,34 @@
+"""Sample TASKS.md content shared by the test modules that scaffold a project tree."""
+
+import functools
+import pathlib
+
+# TASKS.md used when tests/data/sample_tasks.md is not available
+FALLBACK_TASKS = b"""# Test Tasks
+
+## Current Tasks
+
+- [ ] **Test Task 1**:
+  - **ID**: 1
+  - **Priority**: High
+  - **Assignee**: TestUser
+  - **Create Date**: 2025-01-01T12:00:00Z
+  - **Description**: A test task
+
+- [x] **Completed Task**:
+  - **ID**: 2
+  - **Priority**: Medium
+  - **Assignee**: TestUser
+  - **Create Date**: 2025-01-01T10:00:00Z
+  - **Finished Date**: 2025-01-01T11:00:00Z
+  - **Description**: A completed test task
+"""
+
+
+@functools.cache
+def load_sample_tasks_bytes():
+    """Read the sample TASKS.md once per process, falling back to FALLBACK_TASKS."""
+    try:
+        return (pathlib.Path(__file__).parent / "data" / "sample_tasks.md").read_bytes()
+    except FileNotFoundError:
+        return FALLBACK_TASKS
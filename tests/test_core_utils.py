@@ -5,16 +5,14 @@ Comprehensive tests for core_utils.py module.
 Tests the core data structures, constants, and utility functions.
 """
 
-import os
 import pathlib
-import sys
+import subprocess
 import tempfile
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
-
+from taskautomation import core_utils
 from taskautomation.core_utils import (
     DOCS_DIR,
     PLANNING_DIR,
@@ -31,6 +29,22 @@ from taskautomation.core_utils import (
     get_git_root,
 )
 
+# Datetimes for test_format_iso8601_datetime and the timestamp each must contain;
+# the last one checks that microseconds are handled gracefully
+_ISO8601_CASES = (
+    (datetime(2025, 1, 1, 12, 30, 45), "2025-01-01T12:30:45"),
+    (datetime(2024, 12, 31, 23, 59, 59), "2024-12-31T23:59:59"),
+    (datetime(2025, 6, 15, 8, 0, 0, 123456), "2025-06-15T08:00:00"),
+)
+
+# Field values shared by the OperationResult tests; _mk_result overrides any of them
+_DEFAULT_OK = {"success": True, "exit_code": ExitCode.SUCCESS, "message": "test"}
+
+
+def _mk_result(**overrides):
+    """Build an OperationResult from _DEFAULT_OK with fresh data/errors/warnings."""
+    return OperationResult(**{**_DEFAULT_OK, "data": {}, "errors": [], "warnings": [], **overrides})
+
 
 class TestCoreUtils(unittest.TestCase):
     """Test cases for core_utils module."""
@@ -60,8 +74,7 @@ class TestCoreUtils(unittest.TestCase):
         self.assertEqual(ExitCode.USER_ABORT, 4)
 
         # Test that all values are integers
-        for code in ExitCode:
-            self.assertIsInstance(code.value, int)
+        self.assertEqual({type(code.value) for code in ExitCode}, {int})
 
     def test_priority_enum(self):
         """Test Priority enum values."""
@@ -71,8 +84,7 @@ class TestCoreUtils(unittest.TestCase):
         self.assertEqual(Priority.CRITICAL, "Critical")
 
         # Test that all values are strings
-        for priority in Priority:
-            self.assertIsInstance(priority.value, str)
+        self.assertEqual({type(priority.value) for priority in Priority}, {str})
 
     def test_task_status_enum(self):
         """Test TaskStatus enum values."""
@@ -80,34 +92,27 @@ class TestCoreUtils(unittest.TestCase):
         self.assertEqual(TaskStatus.COMPLETED, "completed")
 
         # Test that all values are strings
-        for status in TaskStatus:
-            self.assertIsInstance(status.value, str)
+        self.assertEqual({type(status.value) for status in TaskStatus}, {str})
 
     def test_operation_result_creation(self):
         """Test OperationResult data class creation."""
         # Test successful result
-        success_result = OperationResult(
-            success=True,
-            exit_code=ExitCode.SUCCESS,
-            message="Operation completed successfully",
-            data={"result": "success"},
-            errors=[],
-            warnings=[],
+        success_result = _mk_result(
+            message="Operation completed successfully", data={"result": "success"}
         )
 
         self.assertTrue(success_result.success)
         self.assertEqual(success_result.exit_code, ExitCode.SUCCESS)
         self.assertEqual(success_result.message, "Operation completed successfully")
         self.assertEqual(success_result.data["result"], "success")
-        self.assertEqual(len(success_result.errors), 0)
-        self.assertEqual(len(success_result.warnings), 0)
+        self.assertFalse(success_result.errors)
+        self.assertFalse(success_result.warnings)
 
         # Test failure result
-        failure_result = OperationResult(
+        failure_result = _mk_result(
             success=False,
             exit_code=ExitCode.VALIDATION_ERROR,
             message="Validation failed",
-            data={},
             errors=["Invalid format", "Missing field"],
             warnings=["Deprecated syntax"],
         )
@@ -115,10 +120,8 @@ class TestCoreUtils(unittest.TestCase):
         self.assertFalse(failure_result.success)
         self.assertEqual(failure_result.exit_code, ExitCode.VALIDATION_ERROR)
         self.assertEqual(failure_result.message, "Validation failed")
-        self.assertEqual(len(failure_result.errors), 2)
-        self.assertEqual(len(failure_result.warnings), 1)
-        self.assertIn("Invalid format", failure_result.errors)
-        self.assertIn("Deprecated syntax", failure_result.warnings)
+        self.assertEqual(failure_result.errors, ["Invalid format", "Missing field"])
+        self.assertEqual(failure_result.warnings, ["Deprecated syntax"])
 
     def test_validation_result_creation(self):
         """Test ValidationResult data class creation."""
@@ -126,9 +129,9 @@ class TestCoreUtils(unittest.TestCase):
         valid_result = ValidationResult(is_valid=True, errors=[], warnings=[], context={})
 
         self.assertTrue(valid_result.is_valid)
-        self.assertEqual(len(valid_result.errors), 0)
-        self.assertEqual(len(valid_result.warnings), 0)
-        self.assertEqual(len(valid_result.context), 0)
+        self.assertFalse(valid_result.errors)
+        self.assertFalse(valid_result.warnings)
+        self.assertFalse(valid_result.context)
 
         # Test invalid result with errors
         invalid_result = ValidationResult(
@@ -139,10 +142,8 @@ class TestCoreUtils(unittest.TestCase):
         )
 
         self.assertFalse(invalid_result.is_valid)
-        self.assertEqual(len(invalid_result.errors), 2)
-        self.assertEqual(len(invalid_result.warnings), 1)
-        self.assertIn("Missing ID", invalid_result.errors)
-        self.assertIn("Old format detected", invalid_result.warnings)
+        self.assertEqual(invalid_result.errors, ["Missing ID", "Invalid date format"])
+        self.assertEqual(invalid_result.warnings, ["Old format detected"])
         self.assertEqual(invalid_result.context["field"], "test_field")
 
     def test_task_info_creation(self):
@@ -172,8 +173,8 @@ class TestCoreUtils(unittest.TestCase):
         self.assertEqual(pending_task.create_date, "2025-01-01T12:00:00Z")
         self.assertIsNone(pending_task.finish_date)
         self.assertEqual(pending_task.description, "This is a test task")
-        self.assertEqual(len(pending_task.prerequisites), 1)
-        self.assertEqual(len(pending_task.subtasks), 2)
+        self.assertEqual(pending_task.prerequisites, ["Setup environment"])
+        self.assertEqual(pending_task.subtasks, {"Step 1": False, "Step 2": True})
 
         # Test completed task
         completed_task = TaskInfo(
@@ -201,28 +202,13 @@ class TestCoreUtils(unittest.TestCase):
 
     def test_format_iso8601_datetime(self):
         """Test format_iso8601_datetime function."""
-        # Test with specific datetime
-        test_datetime = datetime(2025, 1, 1, 12, 30, 45)
-        formatted = format_iso8601_datetime(test_datetime)
-
-        self.assertIsInstance(formatted, str)
-        self.assertIn("2025-01-01T12:30:45", formatted)
-        self.assertTrue(formatted.endswith("Z"))
+        for value, expected in _ISO8601_CASES:
+            with self.subTest(value=value):
+                formatted = format_iso8601_datetime(value)
 
-        # Test with different datetime
-        test_datetime2 = datetime(2024, 12, 31, 23, 59, 59)
-        formatted2 = format_iso8601_datetime(test_datetime2)
-
-        self.assertIsInstance(formatted2, str)
-        self.assertIn("2024-12-31T23:59:59", formatted2)
-        self.assertTrue(formatted2.endswith("Z"))
-
-        # Test with microseconds (should be handled gracefully)
-        test_datetime3 = datetime(2025, 6, 15, 8, 0, 0, 123456)
-        formatted3 = format_iso8601_datetime(test_datetime3)
-
-        self.assertIsInstance(formatted3, str)
-        self.assertIn("2025-06-15T08:00:00", formatted3)
+                self.assertIsInstance(formatted, str)
+                self.assertIn(expected, formatted)
+                self.assertTrue(formatted.endswith("Z"))
 
     def test_get_git_root(self):
         """Test get_git_root function."""
@@ -242,47 +228,35 @@ class TestCoreUtils(unittest.TestCase):
     def test_get_git_root_with_temp_dir(self):
         """Test get_git_root function in a temporary directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = pathlib.Path(temp_dir)
-
-            # Change to temp directory and test
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                git_root = get_git_root()
-                # Should return None since temp dir is not a git repo
-                self.assertIsNone(git_root)
-            finally:
-                os.chdir(original_cwd)
+            # Start the search in the temp directory instead of changing into it
+            git_root = get_git_root(pathlib.Path(temp_dir))
+            # Should return None since temp dir is not a git repo
+            self.assertIsNone(git_root)
+
+    def test_get_git_root_is_cached_per_directory(self):
+        """Test that repeated lookups from one directory run git once."""
+        core_utils._find_git_root.cache_clear()
+        self.addCleanup(core_utils._find_git_root.cache_clear)
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch(
+                "taskautomation.core_utils.subprocess.run",
+                return_value=subprocess.CompletedProcess([], 0, stdout="/repo\n"),
+            ) as mock_run,
+        ):
+            first = get_git_root(pathlib.Path(temp_dir))
+            second = get_git_root(pathlib.Path(temp_dir) / ".")
+
+        self.assertEqual(first, pathlib.Path("/repo"))
+        self.assertEqual(second, first)
+        mock_run.assert_called_once()
 
     def test_data_class_equality(self):
         """Test equality comparison for data classes."""
         # Test OperationResult equality
-        result1 = OperationResult(
-            success=True,
-            exit_code=ExitCode.SUCCESS,
-            message="test",
-            data={},
-            errors=[],
-            warnings=[],
-        )
-
-        result2 = OperationResult(
-            success=True,
-            exit_code=ExitCode.SUCCESS,
-            message="test",
-            data={},
-            errors=[],
-            warnings=[],
-        )
-
-        result3 = OperationResult(
-            success=False,
-            exit_code=ExitCode.VALIDATION_ERROR,
-            message="test",
-            data={},
-            errors=[],
-            warnings=[],
-        )
+        result1 = _mk_result()
+        result2 = _mk_result()
+        result3 = _mk_result(success=False, exit_code=ExitCode.VALIDATION_ERROR)
 
         self.assertEqual(result1, result2)
         self.assertNotEqual(result1, result3)
@@ -304,37 +278,8 @@ class TestCoreUtils(unittest.TestCase):
             raw_block="- [ ] **Test**: Test",
         )
 
-        task2 = TaskInfo(
-            title="Test",
-            checked=False,
-            task_id=1,
-            priority="High",
-            assignee="User",
-            create_date="2025-01-01T00:00:00Z",
-            start_date=None,
-            finish_date=None,
-            estimated_time="1 hour",
-            description="Test",
-            prerequisites=[],
-            subtasks={},
-            raw_block="- [ ] **Test**: Test",
-        )
-
-        task3 = TaskInfo(
-            title="Test",
-            checked=False,
-            task_id=2,
-            priority="High",
-            assignee="User",
-            create_date="2025-01-01T00:00:00Z",
-            start_date=None,
-            finish_date=None,
-            estimated_time="1 hour",
-            description="Test",
-            prerequisites=[],
-            subtasks={},
-            raw_block="- [ ] **Test**: Test",
-        )
+        task2 = task1._replace(prerequisites=[], subtasks={})
+        task3 = task1._replace(task_id=2)
 
         self.assertEqual(task1, task2)
         self.assertNotEqual(task1, task3)
@@ -342,14 +287,7 @@ class TestCoreUtils(unittest.TestCase):
     def test_data_class_repr(self):
         """Test string representation of data classes."""
         # Test OperationResult repr
-        result = OperationResult(
-            success=True,
-            exit_code=ExitCode.SUCCESS,
-            message="test message",
-            data={"key": "value"},
-            errors=[],
-            warnings=[],
-        )
+        result = _mk_result(message="test message", data={"key": "value"})
 
         repr_str = repr(result)
         self.assertIn("OperationResult", repr_str)
@@ -404,7 +342,7 @@ class TestCoreUtils(unittest.TestCase):
         self.assertIsNotNone(validation_result.context)
         self.assertEqual(validation_result.context["task_id"], 1)
         self.assertEqual(validation_result.context["field"], "title")
-        self.assertEqual(len(validation_result.warnings), 1)
+        self.assertEqual(validation_result.warnings, ["Minor formatting issue"])
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for create_change_entry.py script."""
 
+import os
 import shutil
 import tempfile
 import unittest
@@ -9,30 +10,76 @@ from pathlib import Path
 from src.taskautomation.create_change_entry import (
     first_task,
     get_paths,
+    get_version,
     main,
     version,
 )
 
+# Keys every get_paths() result must provide
+_REQUIRED_PATH_KEYS = frozenset({"ROOT", "TEMPLATE", "CHANGELOG_DIR", "TASKS_MD", "PYPROJECT"})
+
+# Paths get_paths() derives from the root, relative to it
+_EXPECTED_RELATIVE_PATHS = (
+    ("TEMPLATE", os.path.join("docs", "templates", "changelog", "template.md")),
+    ("CHANGELOG_DIR", os.path.join("docs", "changelog")),
+    ("TASKS_MD", os.path.join("docs", "TASKS.md")),
+    ("PYPROJECT", "pyproject.toml"),
+)
+
+# Argument sets for test_main_creates_changelog and text each changelog must contain;
+# coverage is skipped (or given) to prevent recursive pytest execution
+_MAIN_CASES = (
+    (["--skip-coverage"], None),
+    (
+        [
+            "--skip-coverage",
+            "--change-title",
+            "Test Change",
+            "--author-name",
+            "Test Author",
+            "--change-type",
+            "feature",
+        ],
+        "Test Change",
+    ),
+    (["--coverage-percentage", "85"], "85%"),
+    (["--skip-coverage", "--change-title", "Test Entry"], "Test Entry"),
+)
+
+
+def _link_or_copy(src, dst):
+    """Hardlink a scaffold file, copying instead where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _md_files(directory):
+    """List the Markdown files in a directory with one scandir pass."""
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.name.endswith(".md")]
+
 
 class TestCreateChangeEntry(unittest.TestCase):
     """Test cases for create_change_entry.py functionality."""
 
-    def setUp(self):
-        """Set up test environment with temporary directory."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_root = Path(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Build the scaffold shared by every test once."""
+        cls._shared_tmp = tempfile.TemporaryDirectory()
+        cls._shared_root = Path(cls._shared_tmp.name)
 
         # Create necessary directory structure
-        docs_dir = self.test_root / "docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-
+        docs_dir = cls._shared_root / "docs"
         templates_dir = docs_dir / "templates" / "changelog"
         templates_dir.mkdir(parents=True, exist_ok=True)
 
         changelog_dir = docs_dir / "changelog"
         changelog_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy test data files
+        # Copy test data files; only these scaffold copies are hardlinked into each test
         test_data_dir = Path(__file__).parent / "data"
 
         # Copy template
@@ -49,37 +96,35 @@ class TestCreateChangeEntry(unittest.TestCase):
 
         # Copy pyproject.toml
         pyproject_src = test_data_dir / "pyproject.toml"
-        pyproject_dst = self.test_root / "pyproject.toml"
+        pyproject_dst = cls._shared_root / "pyproject.toml"
         if pyproject_src.exists():
             shutil.copy2(pyproject_src, pyproject_dst)
 
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-
-    def test_get_paths_default(self):
-        """Test get_paths function with default parameters."""
-        paths = get_paths()
-
-        # Should return default paths (dict with all required keys)
-        required_keys = ["ROOT", "TEMPLATE", "CHANGELOG_DIR", "TASKS_MD", "PYPROJECT"]
-        for key in required_keys:
-            self.assertIn(key, paths)
-            self.assertIsInstance(paths[key], Path)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared scaffold."""
+        cls._shared_tmp.cleanup()
 
-    def test_get_paths_override(self):
-        """Test get_paths function with root override."""
-        paths = get_paths(self.test_root)
+    def setUp(self):
+        """Set up test environment with temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
+        self.test_root = Path(self.test_dir)
 
-        # Should use overridden root
-        self.assertEqual(paths["ROOT"], self.test_root)
-        self.assertEqual(
-            paths["TEMPLATE"], self.test_root / "docs" / "templates" / "changelog" / "template.md"
+        # Hardlink the shared scaffold in; the code under test only reads these files
+        # and unlinking one in a test removes just this test's link
+        shutil.copytree(
+            self._shared_root, self.test_root, dirs_exist_ok=True, copy_function=_link_or_copy
         )
+        self._paths = get_paths(self.test_root)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self._tmp.cleanup()
 
     def test_isolated_test_environment(self):
         """Test that test environment is properly isolated."""
-        paths = get_paths(self.test_root)
+        paths = self._paths
 
         # Verify test files exist
         self.assertTrue(paths["TEMPLATE"].exists(), f"Template not found: {paths['TEMPLATE']}")
@@ -108,59 +153,33 @@ class TestCreateChangeEntry(unittest.TestCase):
             "First task:" in result.message or "No unchecked tasks found" in result.message
         )
 
-    def test_main_no_arguments(self):
-        """Test main function with no arguments (uses defaults)."""
-        # Skip coverage to prevent recursive pytest execution
-        result = main(["--skip-coverage"], root_override=self.test_root)
-        # main() function returns None on success and prints the output file path
-        self.assertIsNone(result)
-
-        # Verify changelog file was created
-        changelog_dir = self.test_root / "docs" / "changelog"
-        changelog_files = list(changelog_dir.glob("*.md"))
-        self.assertGreater(len(changelog_files), 0, "No changelog file was created")
-
-    def test_custom_arguments(self):
-        """Test main function with custom arguments."""
-        result = main(
-            [
-                "--skip-coverage",
-                "--change-title",
-                "Test Change",
-                "--author-name",
-                "Test Author",
-                "--change-type",
-                "feature",
-            ],
-            root_override=self.test_root,
-        )
-        # Should succeed and return None
-        self.assertIsNone(result)
-
-        # Verify changelog file was created
-        changelog_dir = self.test_root / "docs" / "changelog"
-        changelog_files = list(changelog_dir.glob("*.md"))
-        self.assertGreater(len(changelog_files), 0)
-
-    def test_coverage_percentage_argument(self):
-        """Test main function with coverage percentage."""
-        result = main(["--coverage-percentage", "85"], root_override=self.test_root)
-        # Should succeed and return None
-        self.assertIsNone(result)
-
-        # Verify changelog file was created with coverage info
-        changelog_dir = self.test_root / "docs" / "changelog"
-        changelog_files = list(changelog_dir.glob("*.md"))
-        self.assertGreater(len(changelog_files), 0)
-
-        # Check that coverage percentage appears in the file
-        changelog_content = changelog_files[0].read_text()
-        self.assertIn("85%", changelog_content)
+    def test_main_creates_changelog(self):
+        """Test main function argument sets against one scaffold."""
+        changelog_dir = self._paths["CHANGELOG_DIR"]
+        for argv, expected in _MAIN_CASES:
+            with self.subTest(argv=argv):
+                # main() function returns None on success and prints the output file path
+                result = main(argv, root_override=self.test_root)
+                self.assertIsNone(result)
+
+                # Exactly one changelog file per run (branch_version_timestamp.md)
+                changelog_files = _md_files(changelog_dir)
+                self.assertEqual(len(changelog_files), 1, "Expected exactly one changelog file")
+                changelog_file = changelog_files[0]
+                self.assertIn("_", changelog_file.name)  # Should contain separators
+
+                content = changelog_file.read_text()
+                self.assertIn("Change Information", content)
+                if expected is not None:
+                    self.assertIn(expected, content)
+
+                # Leave the directory empty for the next argument set
+                changelog_file.unlink()
 
     def test_error_handling_missing_template(self):
         """Test error handling when template file is missing."""
         # Remove template file
-        template_path = self.test_root / "docs" / "templates" / "changelog" / "template.md"
+        template_path = self._paths["TEMPLATE"]
         if template_path.exists():
             template_path.unlink()
 
@@ -172,7 +191,7 @@ class TestCreateChangeEntry(unittest.TestCase):
     def test_error_handling_missing_tasks_file(self):
         """Test error handling when TASKS.md file is missing."""
         # Remove tasks file
-        tasks_path = self.test_root / "docs" / "TASKS.md"
+        tasks_path = self._paths["TASKS_MD"]
         if tasks_path.exists():
             tasks_path.unlink()
 
@@ -181,31 +200,50 @@ class TestCreateChangeEntry(unittest.TestCase):
         self.assertIsNone(result)  # Should still succeed
 
         # Verify changelog file was created
-        changelog_dir = self.test_root / "docs" / "changelog"
-        changelog_files = list(changelog_dir.glob("*.md"))
+        changelog_dir = self._paths["CHANGELOG_DIR"]
+        changelog_files = _md_files(changelog_dir)
         self.assertGreater(len(changelog_files), 0)
 
-    def test_changelog_creation(self):
-        """Test that changelog files are created with proper naming."""
-        result = main(
-            ["--skip-coverage", "--change-title", "Test Entry"], root_override=self.test_root
-        )
-        self.assertIsNone(result)
-
-        # Check that a changelog file was created
-        changelog_dir = self.test_root / "docs" / "changelog"
-        changelog_files = list(changelog_dir.glob("*.md"))
-        self.assertEqual(len(changelog_files), 1)
-
-        # Verify file naming pattern (branch_version_timestamp.md)
-        changelog_file = changelog_files[0]
-        self.assertTrue(changelog_file.name.endswith(".md"))
-        self.assertIn("_", changelog_file.name)  # Should contain separators
-
-        # Verify content contains expected fields
-        content = changelog_file.read_text()
-        self.assertIn("Test Entry", content)
-        self.assertIn("Change Information", content)
+
+class TestCreateChangeEntryPaths(unittest.TestCase):
+    """Test cases for path and version helpers that need no scaffold."""
+
+    def setUp(self):
+        """Set up an empty temporary root."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_root = Path(self._tmp.name)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self._tmp.cleanup()
+
+    def test_get_paths_default(self):
+        """Test get_paths function with default parameters."""
+        paths = get_paths()
+
+        # Should return default paths (dict with all required keys)
+        self.assertFalse(_REQUIRED_PATH_KEYS - paths.keys())
+        self.assertTrue(all(isinstance(paths[key], Path) for key in _REQUIRED_PATH_KEYS))
+
+    def test_get_paths_override(self):
+        """Test get_paths function with root override."""
+        paths = get_paths(self.test_root)
+
+        # Should use overridden root
+        self.assertEqual(paths["ROOT"], self.test_root)
+        for key, relative in _EXPECTED_RELATIVE_PATHS:
+            with self.subTest(key=key):
+                self.assertEqual(paths[key], self.test_root / relative)
+
+    def test_get_version_rereads_changed_pyproject(self):
+        """Test that the cached version parse notices an edited pyproject.toml."""
+        pyproject = self.test_root / "versioned.toml"
+        pyproject.write_text('[project]\nversion = "1.2.3"\n')
+        self.assertEqual(get_version(pyproject), ("1.2.3", "1-2-3"))
+        self.assertEqual(get_version(pyproject), ("1.2.3", "1-2-3"))
+
+        pyproject.write_text('[project]\nversion = "10.20.30"\n')
+        self.assertEqual(get_version(pyproject), ("10.20.30", "10-20-30"))
 
 
 if __name__ == "__main__":
@@ -5,97 +5,87 @@ Comprehensive tests for run_tests.py script.
 Tests the configurable path system and all functionality of the test runner script.
 """
 
-import os
+import io
 import pathlib
-import shutil
-import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from sample_tasks import load_sample_tasks_bytes
 
 from taskautomation.run_tests import (
     get_paths,
     main,
+    parse_test_results,
     update_tasks_file,
 )
 
+# Dummy scripts written into the test tree, and the source each one gets
+_TEST_SCRIPTS = (
+    "task_utils.py",
+    "create_change_entry.py",
+    "validate_automation.py",
+    "run_tests.py",
+)
+_SCRIPT_TEMPLATE = b'#!/usr/bin/env python3\n"""Test %s"""\nprint("Test script %s")\n'
+
 
 class TestRunTests(unittest.TestCase):
     """Test cases for run_tests script."""
 
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Build the test directory once for the whole class."""
         # Create temporary test directory
-        self.test_dir = tempfile.mkdtemp()
-        self.test_root = pathlib.Path(self.test_dir)
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._tmp.name
+        cls.test_root = pathlib.Path(cls.test_dir)
+        cls.tasks_file = cls.test_root / "docs" / "TASKS.md"
+
+        # Tests may rewrite TASKS.md; setUp restores it from this snapshot
+        cls._tasks_snapshot = load_sample_tasks_bytes()
 
         # Set up test directory structure
-        self.setup_test_directory()
+        cls.setup_test_directory()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Restore TASKS.md and stub out the pytest subprocess main() would start."""
+        self.tasks_file.write_bytes(self._tasks_snapshot)
+
+        # main() only needs an exit code and output to parse, not a nested pytest run
+        run_patcher = patch("taskautomation.run_tests.run", return_value=(0, ""))
+        self.mock_run = run_patcher.start()
+        self.addCleanup(run_patcher.stop)
 
-    def setup_test_directory(self):
+    @classmethod
+    def setup_test_directory(cls):
         """Set up the test directory structure."""
         # Create necessary directories
-        (self.test_root / "docs").mkdir(parents=True)
-        (self.test_root / "src" / "taskautomation").mkdir(parents=True)
-        (self.test_root / "tests").mkdir(parents=True)
-
-        # Copy test data files
-        test_data_dir = pathlib.Path(__file__).parent / "data"
-
-        # Copy TASKS.md
-        if (test_data_dir / "sample_tasks.md").exists():
-            shutil.copy2(test_data_dir / "sample_tasks.md", self.test_root / "docs" / "TASKS.md")
-        else:
-            # Create a basic tasks file if test data doesn't exist
-            tasks_content = """# Test Tasks
-
-## Current Tasks
-
-- [ ] **Test Task 1**:
-  - **ID**: 1
-  - **Priority**: High
-  - **Assignee**: TestUser
-  - **Create Date**: 2025-01-01T12:00:00Z
-  - **Description**: A test task
-
-- [x] **Completed Task**:
-  - **ID**: 2
-  - **Priority**: Medium
-  - **Assignee**: TestUser
-  - **Create Date**: 2025-01-01T10:00:00Z
-  - **Finished Date**: 2025-01-01T11:00:00Z
-  - **Description**: A completed test task
-"""
-            (self.test_root / "docs" / "TASKS.md").write_text(tasks_content)
+        (cls.test_root / "docs").mkdir(parents=True)
+        (cls.test_root / "src" / "taskautomation").mkdir(parents=True)
+        (cls.test_root / "tests").mkdir(parents=True)
+
+        # Write TASKS.md
+        cls.tasks_file.write_bytes(cls._tasks_snapshot)
 
         # Create some test script files
-        self.create_test_scripts()
+        cls.create_test_scripts()
 
-    def create_test_scripts(self):
+    @classmethod
+    def create_test_scripts(cls):
         """Create test script files for testing."""
-        scripts_dir = self.test_root / "src" / "taskautomation"
+        scripts_dir = cls.test_root / "src" / "taskautomation"
 
         # Create dummy script files
-        test_scripts = [
-            "task_utils.py",
-            "create_change_entry.py",
-            "validate_automation.py",
-            "run_tests.py",
-        ]
-
-        for script in test_scripts:
-            script_path = scripts_dir / script
-            script_path.write_text(
-                f'#!/usr/bin/env python3\n"""Test {script}"""\nprint("Test script {script}")\n'
-            )
+        for script in _TEST_SCRIPTS:
+            name = script.encode()
+            (scripts_dir / script).write_bytes(_SCRIPT_TEMPLATE % (name, name))
 
     def test_get_paths_default(self):
         """Test get_paths function with default root."""
@@ -148,8 +138,9 @@ class TestRunTests(unittest.TestCase):
         with self.assertRaises(SystemExit) as cm:
             main([], root_override=self.test_root)
 
-        # Should exit with some code (0 or non-zero depending on test results)
-        self.assertIsInstance(cm.exception.code, int)
+        # Should exit with the pytest exit code after running with terminal coverage
+        self.assertEqual(cm.exception.code, 0)
+        self.assertIn("--cov-report=term-missing", self.mock_run.call_args.args[0])
 
     def test_main_with_update_tasks(self):
         """Test main function with update-tasks flag."""
@@ -161,9 +152,8 @@ class TestRunTests(unittest.TestCase):
 
     def test_main_quiet_mode(self):
         """Test main function in quiet mode."""
-        with patch("sys.stdout"):
-            with self.assertRaises(SystemExit) as cm:
-                main(["--quiet"], root_override=self.test_root)
+        with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main(["--quiet"], root_override=self.test_root)
 
         # Should handle quiet mode and exit
         self.assertIsInstance(cm.exception.code, int)
@@ -178,12 +168,12 @@ class TestRunTests(unittest.TestCase):
 
     def test_main_json_format(self):
         """Test main function with coverage none option."""
-        with patch("sys.stdout"):
-            with self.assertRaises(SystemExit) as cm:
-                main(["--coverage", "none"], root_override=self.test_root)
+        with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main(["--coverage", "none"], root_override=self.test_root)
 
-        # Should handle coverage mode and exit
+        # Should handle coverage mode and exit without coverage options
         self.assertIsInstance(cm.exception.code, int)
+        self.assertNotIn("--cov", self.mock_run.call_args.args[0])
 
     def test_isolated_test_environment(self):
         """Test that the test environment is properly isolated."""
@@ -230,7 +220,10 @@ class TestRunTests(unittest.TestCase):
         # Create additional test scripts
         additional_scripts = ["test_script1.py", "test_script2.py"]
         for script in additional_scripts:
-            (src_dir / script).write_text(f'#!/usr/bin/env python3\nprint("Script {script}")\n')
+            script_path = src_dir / script
+            script_path.write_text(f'#!/usr/bin/env python3\nprint("Script {script}")\n')
+            # Keep the shared directory as later tests expect it
+            self.addCleanup(script_path.unlink)
 
         # Should be able to run tests and exit
         with self.assertRaises(SystemExit):
@@ -238,7 +231,7 @@ class TestRunTests(unittest.TestCase):
 
     def test_help_option(self):
         """Test help option functionality."""
-        with patch("sys.stdout"):
+        with redirect_stdout(io.StringIO()):
             try:
                 result = main(["--help"], root_override=self.test_root)
             except SystemExit:
@@ -264,6 +257,23 @@ class TestRunTests(unittest.TestCase):
 
         # Both operations should complete (exit) successfully
 
+    def test_parse_test_results_xdist_output(self):
+        """Test that results printed by pytest-xdist workers are parsed."""
+        output = (
+            "tests/test_a.py::TestA::test_one PASSED                   [ 50%]\n"
+            "[gw0] [ 75%] PASSED tests/test_b.py::TestB::test_two \n"
+            "[gw1] [100%] FAILED tests/test_b.py::TestB::test_three\n"
+        )
+
+        self.assertEqual(
+            parse_test_results(output),
+            [
+                ("tests/test_a.py", "TestA::test_one", "PASSED"),
+                ("tests/test_b.py", "TestB::test_two", "PASSED"),
+                ("tests/test_b.py", "TestB::test_three", "FAILED"),
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,13 +6,16 @@ Tests that the compatibility layer properly imports and exposes all functionalit
 from the specialized modules.
 """
 
+import io
+import json
 import pathlib
-import sys
+import subprocess
 import unittest
+from contextlib import redirect_stdout
 from datetime import datetime
+from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from taskautomation import core_utils
 
 # Test imports from task_utils compatibility layer
 from taskautomation.task_utils import (
@@ -39,13 +42,44 @@ from taskautomation.task_utils import (
     get_git_root,
     # Validation utilities
     is_valid_task_line,
+    output_result,
     parse_legacy_task_format,
     # Markdown parser utilities
     parse_tasks_from_markdown,
+    serialize_result,
     validate_task_format,
     validate_task_schema,
 )
 
+# Legacy-format task shared by the parsing and conversion checks
+_LEGACY_TASK = """## Test Legacy Task
+- Priority: High
+- Assignee: TestUser
+- Created: 2025-01-01
+- Description: Legacy task description
+"""
+
+
+def _make_test_task(**overrides):
+    """Build a fully populated TaskInfo, with any field replaceable by keyword."""
+    fields = {
+        "title": "Test Task",
+        "checked": False,
+        "task_id": 1,
+        "priority": "High",
+        "assignee": "TestUser",
+        "create_date": "2025-01-01T12:00:00Z",
+        "start_date": None,
+        "finish_date": None,
+        "estimated_time": "30 minutes",
+        "description": "Test description",
+        "prerequisites": [],
+        "subtasks": {},
+        "raw_block": "- [ ] **Test Task**:\n  - **ID**: 1",
+    }
+    fields.update(overrides)
+    return TaskInfo(**fields)
+
 
 class TestTaskUtilsCompatibility(unittest.TestCase):
     """Test cases for task_utils compatibility layer."""
@@ -62,24 +96,19 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
     def test_enums_available(self):
         """Test that all required enums are available."""
         # ExitCode enum - check actual available values
-        self.assertTrue(hasattr(ExitCode, "SUCCESS"))
-        self.assertTrue(hasattr(ExitCode, "NO_WORK"))
-        self.assertTrue(hasattr(ExitCode, "VALIDATION_ERROR"))
-        self.assertTrue(hasattr(ExitCode, "SYSTEM_ERROR"))
-        self.assertTrue(hasattr(ExitCode, "USER_ABORT"))
+        self.assertFalse(
+            {"SUCCESS", "NO_WORK", "VALIDATION_ERROR", "SYSTEM_ERROR", "USER_ABORT"}
+            - ExitCode.__members__.keys()
+        )
 
         # Priority enum
-        self.assertTrue(hasattr(Priority, "LOW"))
-        self.assertTrue(hasattr(Priority, "MEDIUM"))
-        self.assertTrue(hasattr(Priority, "HIGH"))
-        self.assertTrue(hasattr(Priority, "CRITICAL"))
+        self.assertFalse({"LOW", "MEDIUM", "HIGH", "CRITICAL"} - Priority.__members__.keys())
 
         # TaskStatus enum - check actual available values
-        self.assertTrue(hasattr(TaskStatus, "PENDING"))
-        self.assertTrue(hasattr(TaskStatus, "COMPLETED"))
-        self.assertTrue(hasattr(TaskStatus, "IN_PROGRESS"))
-        self.assertTrue(hasattr(TaskStatus, "BLOCKED"))
-        self.assertTrue(hasattr(TaskStatus, "CANCELLED"))
+        self.assertFalse(
+            {"PENDING", "COMPLETED", "IN_PROGRESS", "BLOCKED", "CANCELLED"}
+            - TaskStatus.__members__.keys()
+        )
 
     def test_data_classes_available(self):
         """Test that all required data classes are available."""
@@ -99,24 +128,10 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
         # ValidationResult with correct constructor signature
         validation = ValidationResult(is_valid=True, errors=[], warnings=[], context={})
         self.assertTrue(validation.is_valid)
-        self.assertEqual(len(validation.errors), 0)
+        self.assertFalse(validation.errors)
 
         # TaskInfo - requires all 13 fields
-        task = TaskInfo(
-            title="Test Task",
-            checked=False,
-            task_id=1,
-            priority="High",
-            assignee="TestUser",
-            create_date="2025-01-01T12:00:00Z",
-            start_date=None,
-            finish_date=None,
-            estimated_time="30 minutes",
-            description="Test description",
-            prerequisites=[],
-            subtasks={},
-            raw_block="- [ ] **Test Task**:\n  - **ID**: 1",
-        )
+        task = _make_test_task()
         self.assertEqual(task.task_id, 1)
         self.assertEqual(task.title, "Test Task")
         self.assertEqual(task.priority, "High")
@@ -129,9 +144,16 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
         self.assertIsInstance(formatted, str)
         self.assertIn("2025-01-01T12:00:00", formatted)
 
-        # Test get_git_root (should work even if not in git repo)
-        git_root = get_git_root()
-        self.assertTrue(git_root is None or isinstance(git_root, pathlib.Path))
+        # Test get_git_root without starting git; the lookup is cached per directory
+        core_utils._find_git_root.cache_clear()
+        self.addCleanup(core_utils._find_git_root.cache_clear)
+        with patch(
+            "taskautomation.core_utils.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, stdout="/repo\n"),
+        ) as mock_run:
+            git_root = get_git_root()
+        mock_run.assert_called_once()
+        self.assertEqual(git_root, pathlib.Path("/repo"))
 
     def test_validation_functions(self):
         """Test that validation functions are available."""
@@ -201,24 +223,11 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
         self.assertGreater(len(tasks), 0)
 
         # Test legacy parsing functions
-        legacy_format = """## Test Legacy Task
-- Priority: High
-- Assignee: TestUser
-- Created: 2025-01-01
-- Description: Legacy task description
-"""
-
-        legacy_task = parse_legacy_task_format(legacy_format)
+        legacy_task = parse_legacy_task_format(_LEGACY_TASK)
         self.assertIsInstance(legacy_task, dict)
 
         # Test convert_legacy_to_new_format - returns string input as-is
-        legacy_format_string = """## Test Legacy Task
-- Priority: High
-- Assignee: TestUser
-- Created: 2025-01-01
-- Description: Legacy task description
-"""
-        converted = convert_legacy_to_new_format(legacy_format_string)
+        converted = convert_legacy_to_new_format(_LEGACY_TASK)
         self.assertIsInstance(converted, str)
 
     def test_validation_schema_functions(self):
@@ -258,18 +267,21 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
         # Verify that we can import from the main module
         import taskautomation.task_utils as task_utils
 
-        # Test that key functions exist
-        self.assertTrue(hasattr(task_utils, "OperationResult"))
-        self.assertTrue(hasattr(task_utils, "ValidationResult"))
-        self.assertTrue(hasattr(task_utils, "TaskInfo"))
-        self.assertTrue(hasattr(task_utils, "ExitCode"))
-        self.assertTrue(hasattr(task_utils, "Priority"))
-        self.assertTrue(hasattr(task_utils, "TaskStatus"))
-
-        # Test that utility functions exist
-        self.assertTrue(hasattr(task_utils, "is_valid_task_line"))
-        self.assertTrue(hasattr(task_utils, "parse_tasks_from_markdown"))
-        self.assertTrue(hasattr(task_utils, "format_iso8601_datetime"))
+        # Test that key classes and utility functions exist
+        self.assertFalse(
+            {
+                "OperationResult",
+                "ValidationResult",
+                "TaskInfo",
+                "ExitCode",
+                "Priority",
+                "TaskStatus",
+                "is_valid_task_line",
+                "parse_tasks_from_markdown",
+                "format_iso8601_datetime",
+            }
+            - vars(task_utils).keys()
+        )
 
     def test_backward_compatibility(self):
         """Test that existing code using task_utils still works."""
@@ -291,29 +303,39 @@ class TestTaskUtilsCompatibility(unittest.TestCase):
             is_valid=True,
             errors=[],
             warnings=[],
-            context={
-                "task_info": TaskInfo(
-                    title="Test",
-                    checked=False,
-                    task_id=1,
-                    priority="Medium",
-                    assignee="Test",
-                    create_date="2025-01-01T12:00:00Z",
-                    start_date=None,
-                    finish_date=None,
-                    estimated_time="30 minutes",
-                    description="Test",
-                    prerequisites=[],
-                    subtasks={},
-                    raw_block="- [ ] **Test**:\n  - **ID**: 1",
-                )
-            },
+            context={"task_info": _make_test_task(priority="Medium")},
         )
 
         self.assertTrue(validation.is_valid)
         self.assertIsNotNone(validation.context.get("task_info"))
         self.assertEqual(validation.context["task_info"].task_id, 1)
 
+    def test_serialize_result_matches_output_result(self):
+        """Test that serialize_result renders exactly what output_result prints."""
+        result = OperationResult(
+            success=False,
+            exit_code=ExitCode.VALIDATION_ERROR,
+            message="Serialization test",
+            data={"test": "data"},
+            errors=["an error"],
+            warnings=["a warning"],
+        )
+
+        for format_type in ("human", "json"):
+            with self.subTest(format_type=format_type):
+                buffer = io.StringIO()
+                with redirect_stdout(buffer):
+                    output_result(result, format_type)
+                self.assertEqual(buffer.getvalue(), serialize_result(result, format_type) + "\n")
+
+        self.assertEqual(json.loads(serialize_result(result, "json"))["exit_code"], 2)
+        self.assertEqual(serialize_result(result, "human", quiet=True), "")
+
+        # Quiet JSON is compact but carries the same data
+        compact = serialize_result(result, "json", quiet=True)
+        self.assertNotIn("\n", compact)
+        self.assertEqual(json.loads(compact), json.loads(serialize_result(result, "json")))
+
     def test_constants_types(self):
         """Test that constants have correct types."""
         # Path constants should be Path objects
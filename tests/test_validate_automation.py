@@ -5,17 +5,18 @@ Comprehensive tests for validate_automation.py script.
 Tests the configurable path system and all functionality of the automation validator.
 """
 
+import io
 import os
 import pathlib
 import shutil
-import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+from sample_tasks import load_sample_tasks_bytes
 
+from taskautomation import validate_automation
 from taskautomation.task_utils import ExitCode, OperationResult
 from taskautomation.validate_automation import (
     AutomationValidator,
@@ -23,89 +24,129 @@ from taskautomation.validate_automation import (
     main,
 )
 
+# AutomationValidator methods that each return an OperationResult when called bare
+_VALIDATION_METHODS = (
+    "validate_module_imports",
+    "validate_file_structure",
+    "test_validation_functions",
+    "validate_existing_tasks",
+    "test_git_integration",
+    "test_output_formats",
+)
 
-class TestValidateAutomation(unittest.TestCase):
-    """Test cases for validate_automation script."""
+# Argument lists for test_main_option_combinations, starting with the defaults
+_MAIN_ARGVS = (
+    [],
+    ["--format", "json"],
+    ["--quiet"],
+    ["--tests", "imports,structure"],
+    ["--fix-issues"],
+    ["--dry-run"],
+)
+
+# Script files validation expects, all given the same dummy body
+_REQUIRED_SCRIPTS = (
+    "task_utils.py",
+    "create_change_entry.py",
+    "run_tests.py",
+)
+_DUMMY_SCRIPT = b'''#!/usr/bin/env python3
+"""
+Test script for validation testing.
+"""
+
+def main():
+    """Main function for testing."""
+    return "Test script executed"
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def _copy_scaffold_file(src, dst):
+    """Hardlink the dummy scripts, which tests only ever delete; copy files tests edit in place."""
+    if src.endswith(".py"):
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copyfile(src, dst)
+
+
+class _ScaffoldTestCase(unittest.TestCase):
+    """Base for tests that each work on a private copy of one shared scaffold."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the directory structure every test starts from once."""
+        cls._shared_tmp = tempfile.TemporaryDirectory()
+        cls._template_root = pathlib.Path(cls._shared_tmp.name)
+
+        # Set up test directory structure
+        cls.setup_test_directory(cls._template_root)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared template."""
+        cls._shared_tmp.cleanup()
 
     def setUp(self):
         """Set up test environment."""
         # Create temporary test directory
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.test_root = pathlib.Path(self.test_dir)
 
-        # Set up test directory structure
-        self.setup_test_directory()
+        # Validation outcomes cached by an earlier test must not leak into this one
+        validate_automation._TASKS_VALIDATION_CACHE.clear()
 
     def tearDown(self):
         """Clean up test environment."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-
-    def setup_test_directory(self):
-        """Set up the test directory structure."""
-        # Create necessary directories
-        (self.test_root / "docs").mkdir(parents=True)
-        (self.test_root / "docs" / "planning").mkdir(parents=True)
-        (self.test_root / "src" / "taskautomation").mkdir(parents=True)
-
-        # Copy test data files
-        test_data_dir = pathlib.Path(__file__).parent / "data"
-
-        # Copy TASKS.md
-        if (test_data_dir / "sample_tasks.md").exists():
-            shutil.copy2(test_data_dir / "sample_tasks.md", self.test_root / "docs" / "TASKS.md")
-        else:
-            # Create a basic tasks file if test data doesn't exist
-            tasks_content = """# Test Tasks
-
-## Current Tasks
-
-- [ ] **Test Task 1**:
-  - **ID**: 1
-  - **Priority**: High
-  - **Assignee**: TestUser
-  - **Create Date**: 2025-01-01T12:00:00Z
-  - **Description**: A test task
-
-- [x] **Completed Task**:
-  - **ID**: 2
-  - **Priority**: Medium
-  - **Assignee**: TestUser
-  - **Create Date**: 2025-01-01T10:00:00Z
-  - **Finished Date**: 2025-01-01T11:00:00Z
-  - **Description**: A completed test task
-"""
-            (self.test_root / "docs" / "TASKS.md").write_text(tasks_content)
+        self._tmp.cleanup()
+
+    def _copy_scaffold(self, omit=None):
+        """Copy the shared scaffold into this test's root, leaving out entries named omit."""
+        # Tests edit, delete and cache files under their root, so each gets its own copy
+        shutil.copytree(
+            self._template_root,
+            self.test_root,
+            ignore=shutil.ignore_patterns(omit) if omit else None,
+            dirs_exist_ok=True,
+            copy_function=_copy_scaffold_file,
+        )
+
+    @classmethod
+    def setup_test_directory(cls, root):
+        """Set up the test directory structure under root."""
+        # Create necessary directories (docs comes with docs/planning)
+        os.makedirs(root / "docs" / "planning")
+        os.makedirs(root / "src" / "taskautomation")
+
+        # Write TASKS.md
+        (root / "docs" / "TASKS.md").write_bytes(load_sample_tasks_bytes())
 
         # Create required script files
-        self.create_required_scripts()
+        cls.create_required_scripts(root)
 
-    def create_required_scripts(self):
-        """Create the required script files for validation."""
-        scripts_dir = self.test_root / "src" / "taskautomation"
+    @classmethod
+    def create_required_scripts(cls, root):
+        """Create the required script files for validation under root."""
+        scripts_dir = root / "src" / "taskautomation"
 
         # Create dummy script files that validation expects
-        required_scripts = [
-            "task_utils.py",
-            "create_change_entry.py",
-            "run_tests.py",
-        ]
+        for script in _REQUIRED_SCRIPTS:
+            (scripts_dir / script).write_bytes(_DUMMY_SCRIPT)
 
-        for script in required_scripts:
-            script_path = scripts_dir / script
-            script_content = f'''#!/usr/bin/env python3
-"""
-Test {script} for validation testing.
-"""
 
-def main():
-    """Main function for testing."""
-    return "Test {script} executed"
+class TestValidateAutomation(_ScaffoldTestCase):
+    """Test cases for validate_automation script."""
 
-if __name__ == "__main__":
-    main()
-'''
-            script_path.write_text(script_content)
+    def setUp(self):
+        """Set up test environment with the full scaffold."""
+        super().setUp()
+        self._copy_scaffold()
 
     def test_get_paths_default(self):
         """Test get_paths function with default root."""
@@ -137,7 +178,7 @@ if __name__ == "__main__":
         self.assertFalse(validator.quiet)
         self.assertEqual(validator.format_type, "human")
         self.assertTrue(validator.overall_success)
-        self.assertEqual(len(validator.results), 0)
+        self.assertFalse(validator.results)
         self.assertEqual(validator.paths["ROOT"], self.test_root)
 
     def test_automation_validator_initialization_options(self):
@@ -151,65 +192,142 @@ if __name__ == "__main__":
         self.assertEqual(validator.format_type, "json")
         self.assertEqual(validator.paths["ROOT"], self.test_root)
 
-    def test_validate_module_imports(self):
-        """Test validate_module_imports method."""
-        validator = AutomationValidator(root_override=self.test_root)
-
-        result = validator.validate_module_imports()
-
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
-
-    def test_validate_file_structure(self):
-        """Test validate_file_structure method."""
+    def test_validation_methods_return_operation_result(self):
+        """Test that every validation method returns an OperationResult."""
         validator = AutomationValidator(root_override=self.test_root)
 
-        result = validator.validate_file_structure()
-
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+        for method_name in _VALIDATION_METHODS:
+            with self.subTest(method=method_name):
+                result = getattr(validator, method_name)()
+                self.assertIsInstance(result, OperationResult)
 
-    def test_test_validation_functions(self):
-        """Test test_validation_functions method."""
+    def test_validate_module_imports(self):
+        """Test validate_module_imports method."""
         validator = AutomationValidator(root_override=self.test_root)
 
-        result = validator.test_validation_functions()
-
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+        result = validator.validate_module_imports()
 
-    def test_validate_existing_tasks(self):
-        """Test validate_existing_tasks method."""
-        validator = AutomationValidator(root_override=self.test_root)
+        # All stdlib modules and task_utils should resolve in a healthy environment
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["task_utils_imports"], "success")
 
-        result = validator.validate_existing_tasks()
+    def test_validate_module_imports_missing_module(self):
+        """Test that an unresolvable module is reported without importing anything."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
 
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+        with (
+            patch(
+                "taskautomation.validate_automation.REQUIRED_MODULES",
+                ("json", "no_such_module_xyz"),
+            ),
+            patch("importlib.import_module") as mock_import,
+        ):
+            result = validator.validate_module_imports()
 
-    def test_test_git_integration(self):
-        """Test test_git_integration method."""
-        validator = AutomationValidator(root_override=self.test_root)
+        mock_import.assert_not_called()
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("no_such_module_xyz", result.errors[0])
 
-        result = validator.test_git_integration()
+    def test_validate_existing_tasks_distribution(self):
+        """Test validate_existing_tasks aggregates task distribution counts."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        blocks = [
+            ("A", 1, "High", "TestUser", " "),
+            ("B", 2, "High", "OtherUser", "x"),
+            ("C", 3, "Low", "TestUser", " "),
+        ]
+        content = "# Test Tasks\n\n## Current Tasks\n\n" + "\n".join(
+            f"- [{mark}] **Task {title}**:\n"
+            f"  - **ID**: {task_id}\n"
+            f"  - **Priority**: {priority}\n"
+            f"  - **Assignee**: {assignee}\n"
+            f"  - **Create Date**: 2025-01-01T12:00:00Z\n"
+            f"  - **Description**: Task {title}\n"
+            for title, task_id, priority, assignee, mark in blocks
+        )
+        validator.paths["TASKS_FILE"].write_text(content)
+
+        with patch(
+            "taskautomation.validate_automation.parse_existing_tasks",
+            wraps=validate_automation.parse_existing_tasks,
+        ) as mock_parse:
+            result = validator.validate_existing_tasks()
+
+        # Validation and the distribution summary share one parse of the file
+        mock_parse.assert_called_once()
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["task_count"], 3)
+        self.assertEqual(result.data["priority_distribution"], {"High": 2, "Low": 1})
+        self.assertEqual(result.data["assignee_distribution"], {"TestUser": 2, "OtherUser": 1})
+        self.assertEqual(result.data["completion_status"], {"completed": 1, "in_progress": 2})
+        self.assertIs(type(result.data["priority_distribution"]), dict)
+
+    def test_validate_existing_tasks_cache(self):
+        """Test that an unchanged tasks file is not re-validated."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        validator.paths["TASKS_FILE"].write_text(
+            "# Test Tasks\n\n## Current Tasks\n\n"
+            "- [ ] **Task A**:\n"
+            "  - **ID**: 1\n"
+            "  - **Priority**: High\n"
+            "  - **Assignee**: TestUser\n"
+            "  - **Create Date**: 2025-01-01T12:00:00Z\n"
+            "  - **Description**: Task A\n"
+        )
 
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+        first = validator.validate_existing_tasks()
+        self.assertTrue(first.success)
+        self.assertNotIn("validation_cache", first.data)
+
+        with patch("taskautomation.validate_automation.validate_tasks_file") as mock_validate:
+            second = validator.validate_existing_tasks()
+
+        mock_validate.assert_not_called()
+        self.assertEqual(second.data["validation_cache"], "hit")
+        self.assertEqual(second.data["priority_distribution"], {"High": 1})
+
+        # Editing the file invalidates the cached outcome
+        with validator.paths["TASKS_FILE"].open("a") as f:
+            f.write("\n")
+        third = validator.validate_existing_tasks()
+        self.assertNotIn("validation_cache", third.data)
+
+    def test_git_info_cached_across_validators(self):
+        """Test that only the working tree status is re-read after the first git check."""
+        git_info = {
+            "branch": "main",
+            "commit": "abcdef12",
+            "user_name": "TestUser",
+            "user_email": "test@example.com",
+            "is_clean": True,
+            "has_uncommitted": False,
+        }
+
+        with (
+            patch("taskautomation.validate_automation._GIT_INFO_CACHE", None),
+            patch(
+                "taskautomation.validate_automation.get_git_info", return_value=git_info
+            ) as mock_git_info,
+            patch(
+                "taskautomation.validate_automation.run_git_command",
+                return_value=(True, " M docs/TASKS.md", ""),
+            ) as mock_git_command,
+        ):
+            first = AutomationValidator(quiet=True, root_override=self.test_root)
+            second = AutomationValidator(quiet=True, root_override=self.test_root)
+            first_result = first.test_git_integration()
+            second_result = second.test_git_integration()
+
+        mock_git_info.assert_called_once()
+        mock_git_command.assert_called_once_with(["status", "--porcelain"])
+        for key in ("branch", "commit", "user_name", "user_email"):
+            with self.subTest(key=key):
+                self.assertEqual(second_result.data[key], git_info[key])
+        self.assertFalse(first_result.data["has_uncommitted"])
+        self.assertTrue(second_result.data["has_uncommitted"])
+        self.assertFalse(second_result.data["is_clean"])
+        self.assertIn("Working directory has uncommitted changes", second_result.warnings)
 
     def test_test_output_formats(self):
         """Test test_output_formats method."""
@@ -217,11 +335,24 @@ if __name__ == "__main__":
 
         result = validator.test_output_formats()
 
-        # Should return OperationResult
-        self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+        # Both formats should render without touching stdout
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["json_format"], "valid")
+        self.assertEqual(result.data["human_format"], "generated")
+        self.assertEqual(result.warnings, [])
+
+    def test_validation_time_shared_by_run(self):
+        """Test that the header and summary of a run report the same timestamp."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+
+        with patch(
+            "taskautomation.validate_automation.get_current_datetime",
+            side_effect=["2025-01-01T12:00:00Z", "2025-01-01T12:00:05Z"],
+        ) as mock_now:
+            result = validator.run_selective_validation(["imports"])
+
+        mock_now.assert_called_once()
+        self.assertEqual(result.data["validation_time"], "2025-01-01T12:00:00Z")
 
     def test_get_available_tests(self):
         """Test get_available_tests method."""
@@ -236,11 +367,14 @@ if __name__ == "__main__":
             self.assertIn(test_name, tests)
             self.assertTrue(callable(tests[test_name]))
 
+        # The mapping is built once per validator
+        self.assertIs(validator.get_available_tests(), tests)
+
     def test_list_available_tests_human(self):
         """Test list_available_tests method with human format."""
         validator = AutomationValidator(format_type="human", root_override=self.test_root)
 
-        with patch("sys.stdout"):
+        with redirect_stdout(io.StringIO()):
             validator.list_available_tests()
 
         # Should execute without error
@@ -250,7 +384,7 @@ if __name__ == "__main__":
         """Test list_available_tests method with JSON format."""
         validator = AutomationValidator(format_type="json", root_override=self.test_root)
 
-        with patch("sys.stdout"):
+        with redirect_stdout(io.StringIO()):
             validator.list_available_tests()
 
         # Should execute without error
@@ -264,9 +398,19 @@ if __name__ == "__main__":
 
         # Should return OperationResult
         self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
+
+    def test_run_selective_validation_test_exception(self):
+        """Test that a raising validation test is logged with its traceback."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+
+        with patch.object(validator, "test_git_integration", side_effect=RuntimeError("boom")):
+            result = validator.run_selective_validation(["git"])
+
+        self.assertFalse(result.success)
+        logged = validator.results[0]
+        self.assertEqual(logged.exit_code, ExitCode.SYSTEM_ERROR)
+        self.assertEqual(logged.errors[0], "Exception: boom")
+        self.assertIn("RuntimeError", logged.errors[1])
 
     def test_run_selective_validation_invalid_tests(self):
         """Test run_selective_validation method with invalid test names."""
@@ -286,106 +430,134 @@ if __name__ == "__main__":
 
         # Should return OperationResult
         self.assertIsInstance(result, OperationResult)
-        self.assertTrue(hasattr(result, "success"))
-        self.assertTrue(hasattr(result, "exit_code"))
-        self.assertTrue(hasattr(result, "message"))
-
-    def test_main_default_behavior(self):
-        """Test main function with default behavior."""
-        with patch("sys.stdout"):
-            try:
-                result = main([], root_override=self.test_root)
-            except SystemExit as e:
-                # main() calls sys.exit(), capture the exit code
-                self.assertIsInstance(e.code, int)
-
-    def test_main_with_format_json(self):
-        """Test main function with JSON format."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--format", "json"], root_override=self.test_root)
-            except SystemExit as e:
-                self.assertIsInstance(e.code, int)
-
-    def test_main_with_quiet_flag(self):
-        """Test main function with quiet flag."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--quiet"], root_override=self.test_root)
-            except SystemExit as e:
-                self.assertIsInstance(e.code, int)
-
-    def test_main_with_selective_tests(self):
-        """Test main function with selective tests."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--tests", "imports,structure"], root_override=self.test_root)
-            except SystemExit as e:
-                self.assertIsInstance(e.code, int)
-
-    def test_main_with_list_tests(self):
-        """Test main function with list-tests option."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--list-tests"], root_override=self.test_root)
-            except SystemExit as e:
-                # Should exit with 0 for successful listing
-                self.assertEqual(e.code, 0)
-
-    def test_main_with_fix_issues(self):
-        """Test main function with fix-issues flag."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--fix-issues"], root_override=self.test_root)
-            except SystemExit as e:
-                self.assertIsInstance(e.code, int)
-
-    def test_main_with_dry_run(self):
-        """Test main function with dry-run flag."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--dry-run"], root_override=self.test_root)
-            except SystemExit as e:
-                self.assertIsInstance(e.code, int)
+
+    def test_run_comprehensive_validation_stops_on_import_failure(self):
+        """Test that an import failure skips the remaining validation tests."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        failed_imports = OperationResult(
+            success=False,
+            exit_code=ExitCode.SYSTEM_ERROR,
+            message="Module import validation completed",
+            data={},
+            errors=["Required module 'json' not available"],
+            warnings=[],
+        )
+
+        with (
+            patch.object(validator, "validate_module_imports", return_value=failed_imports),
+            patch.object(validator, "validate_file_structure") as mock_structure,
+        ):
+            result = validator.run_comprehensive_validation()
+
+        mock_structure.assert_not_called()
+        self.assertFalse(result.success)
+        self.assertEqual(result.data["total_tests"], 6)
+        self.assertEqual(result.data["failed_tests"], 6)
+        self.assertTrue(all(r.data.get("skipped") for r in validator.results[1:]))
+        self.assertEqual(
+            result.data["skipped_tests"], ["structure", "functions", "tasks", "git", "output"]
+        )
+
+    def test_run_selective_validation_stops_on_import_failure(self):
+        """Test that a selective run also skips the tests after a failed import check."""
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        failed_imports = OperationResult(
+            success=False,
+            exit_code=ExitCode.SYSTEM_ERROR,
+            message="Module import validation completed",
+            data={},
+            errors=["Required module 'json' not available"],
+            warnings=[],
+        )
+
+        with (
+            patch.object(validator, "validate_module_imports", return_value=failed_imports),
+            patch.object(validator, "test_git_integration") as mock_git,
+        ):
+            result = validator.run_selective_validation(["imports", "git"])
+
+        mock_git.assert_not_called()
+        self.assertEqual(result.data["skipped_tests"], ["git"])
+        self.assertEqual(result.data["failed_tests"], 2)
+
+    def test_summary_message_matches_format(self):
+        """Test that only human summaries carry emoji markers."""
+        human = AutomationValidator(quiet=True, root_override=self.test_root)
+        machine = AutomationValidator(quiet=True, format_type="json", root_override=self.test_root)
+
+        human_result = human.run_selective_validation(["imports"])
+        json_result = machine.run_selective_validation(["imports"])
+
+        self.assertTrue(human_result.message.startswith("✅ "))
+        self.assertEqual(json_result.message, "All 1 selected validation tests passed")
+        self.assertTrue(json_result.message.isascii())
+
+    def test_main_option_combinations(self):
+        """Test main function with default behavior and each common option."""
+        for argv in _MAIN_ARGVS:
+            with self.subTest(argv=argv), redirect_stdout(io.StringIO()):
+                self.assertIsInstance(main(argv, root_override=self.test_root), int)
+
+    def test_main_selective_tests_tolerates_spacing(self):
+        """Test that spaces and empty entries in --tests are ignored."""
+        with (
+            redirect_stdout(io.StringIO()),
+            patch.object(
+                AutomationValidator, "run_selective_validation", autospec=True
+            ) as mock_run,
+        ):
+            mock_run.return_value = OperationResult(
+                success=True,
+                exit_code=ExitCode.SUCCESS,
+                message="ok",
+                data={},
+                errors=[],
+                warnings=[],
+            )
+            main(["--tests", "imports, git,", "--quiet"], root_override=self.test_root)
+
+        self.assertEqual(mock_run.call_args.args[1], ["imports", "git"])
+
+    def test_main_list_tests_skips_parser(self):
+        """Test that a bare --list-tests does not build the argument parser."""
+        with redirect_stdout(io.StringIO()), patch("argparse.ArgumentParser") as mock_parser:
+            exit_code = main(["--list-tests"], root_override=self.test_root)
+
+        self.assertEqual(exit_code, 0)
+        mock_parser.assert_not_called()
 
     def test_isolated_test_environment(self):
         """Test that the test environment is properly isolated."""
-        # Test directory should exist
-        self.assertTrue(self.test_root.exists())
+        # One scandir per directory; DirEntry type checks reuse the listing's metadata
+        root_entries = {entry.name: entry for entry in os.scandir(self.test_root)}
+        docs_entries = {entry.name: entry for entry in os.scandir(self.test_root / "docs")}
+        src_entries = {entry.name: entry for entry in os.scandir(self.test_root / "src")}
 
         # Required directories should exist
-        self.assertTrue((self.test_root / "docs").exists())
-        self.assertTrue((self.test_root / "src" / "taskautomation").exists())
-        self.assertTrue((self.test_root / "docs" / "planning").exists())
+        self.assertTrue(root_entries["docs"].is_dir())
+        self.assertTrue(src_entries["taskautomation"].is_dir())
+        self.assertTrue(docs_entries["planning"].is_dir())
 
         # Required files should exist
-        self.assertTrue((self.test_root / "docs" / "TASKS.md").exists())
-
-    def test_validation_with_missing_files(self):
-        """Test validation behavior when required files are missing."""
-        # Remove a required file
-        tasks_file = self.test_root / "docs" / "TASKS.md"
-        if tasks_file.exists():
-            tasks_file.unlink()
-
-        validator = AutomationValidator(quiet=True, root_override=self.test_root)
-        result = validator.validate_existing_tasks()
-
-        # Should handle missing file gracefully
-        self.assertIsInstance(result, OperationResult)
+        self.assertTrue(docs_entries["TASKS.md"].is_file())
 
-    def test_validation_with_missing_directories(self):
-        """Test validation behavior when required directories are missing."""
-        # Remove a required directory
+    def test_validation_with_wrong_path_types(self):
+        """Test validation reports paths that exist but have the wrong type."""
+        run_tests_path = self.test_root / "src" / "taskautomation" / "run_tests.py"
+        run_tests_path.unlink()
+        run_tests_path.mkdir()
         planning_dir = self.test_root / "docs" / "planning"
-        if planning_dir.exists():
-            shutil.rmtree(planning_dir)
+        shutil.rmtree(planning_dir)
+        planning_dir.write_text("not a directory")
 
         validator = AutomationValidator(quiet=True, root_override=self.test_root)
         result = validator.validate_file_structure()
 
-        # Should detect missing directory
-        self.assertIsInstance(result, OperationResult)
+        self.assertFalse(result.success)
+        self.assertIn(f"Path exists but is not a file: {run_tests_path}", result.errors)
+        self.assertIn(f"Path exists but is not a directory: {planning_dir}", result.errors)
+        self.assertTrue(result.data["found_task_utils.py"])
+        self.assertNotIn("found_run_tests.py", result.data)
 
     def test_log_result_functionality(self):
         """Test log_result method functionality."""
@@ -409,6 +581,18 @@ if __name__ == "__main__":
         self.assertEqual(validator.results[0], test_result)
         self.assertTrue(validator.overall_success)
 
+    def test_log_result_without_keeping_results(self):
+        """Test that summary counters work when individual results are not retained."""
+        validator = AutomationValidator(
+            quiet=True, root_override=self.test_root, keep_results=False
+        )
+
+        result = validator.run_selective_validation(["imports", "structure"])
+
+        self.assertEqual(validator.results, [])
+        self.assertEqual(result.data["total_tests"], 2)
+        self.assertEqual(result.data["passed_tests"] + result.data["failed_tests"], 2)
+
     def test_log_result_with_failure(self):
         """Test log_result method with failure result."""
         validator = AutomationValidator(quiet=True, root_override=self.test_root)
@@ -430,14 +614,44 @@ if __name__ == "__main__":
         self.assertEqual(len(validator.results), 1)
         self.assertFalse(validator.overall_success)
 
+        # Summary counters are updated as results come in
+        self.assertEqual(validator._passed, 0)
+        self.assertEqual(validator._total_errors, 1)
+        self.assertEqual(validator._total_warnings, 0)
+
     def test_help_option(self):
-        """Test help option functionality."""
-        with patch("sys.stdout"):
-            try:
-                result = main(["--help"], root_override=self.test_root)
-            except SystemExit as e:
-                # argparse calls sys.exit() on --help
-                self.assertEqual(e.code, 0)
+        """Test that the help text documents every option."""
+        help_text = validate_automation._build_parser().format_help()
+
+        options = ("--format", "--quiet", "--fix-issues", "--dry-run", "--tests", "--list-tests")
+        for option in options:
+            self.assertIn(option, help_text)
+
+
+class TestValidateAutomationPartialScaffold(_ScaffoldTestCase):
+    """Test cases that copy the scaffold with a required entry left out."""
+
+    def test_validation_with_missing_files(self):
+        """Test validation behavior when required files are missing."""
+        self._copy_scaffold(omit="TASKS.md")
+        self.assertFalse((self.test_root / "docs" / "TASKS.md").exists())
+
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        result = validator.validate_existing_tasks()
+
+        # Should handle missing file gracefully
+        self.assertIsInstance(result, OperationResult)
+
+    def test_validation_with_missing_directories(self):
+        """Test validation behavior when required directories are missing."""
+        self._copy_scaffold(omit="planning")
+        self.assertFalse((self.test_root / "docs" / "planning").exists())
+
+        validator = AutomationValidator(quiet=True, root_override=self.test_root)
+        result = validator.validate_file_structure()
+
+        # Should detect missing directory
+        self.assertIsInstance(result, OperationResult)
 
 
 if __name__ == "__main__":
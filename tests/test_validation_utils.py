@@ -5,27 +5,120 @@ Comprehensive tests for validation_utils.py module.
 Tests all validation functions and task parsing logic.
 """
 
+import os
 import pathlib
-import sys
+import random
+import re
+import tempfile
 import unittest
+from unittest.mock import patch
 
-# Add src to path for imports
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
-
-from taskautomation.core_utils import ValidationResult
+from taskautomation import validation_utils
+from taskautomation.core_utils import TaskInfo, ValidationResult
 from taskautomation.validation_utils import (
     extract_assignee,
     extract_create_date,
     extract_description,
     extract_finished_date,
     extract_priority,
+    extract_task_fields,
     extract_task_id,
     is_valid_task_line,
+    validate_prerequisites,
+    validate_task_data,
     validate_task_format,
     validate_task_schema,
+    validate_tasks_file,
+    verify_operation_safety,
+)
+
+# Task text with a single field line, filled in by _make_task_text
+_TASK_TEMPLATE = "- [ ] **Test Task**:\n    - {key}: {value}\n    - Description: Test"
+
+
+def _make_task_text(key, value):
+    """Build task text holding one "key: value" field line."""
+    return _TASK_TEMPLATE.format(key=key, value=value)
+
+
+# Priority spellings for test_extract_priority and the canonical form each extracts to
+_PRIORITY_CASES = (
+    ("Low", "Low"),
+    ("Medium", "Medium"),
+    ("High", "High"),
+    ("Critical", "Critical"),
+    ("urgent", "Urgent"),  # Should be title-cased
+)
+
+# Valid ISO8601 formats for test_date_parsing_edge_cases
+_DATE_FORMATS = (
+    "2025-01-01T12:00:00Z",
+    "2025-01-01T12:00:00+00:00",
+    "2025-01-01T12:00:00.000Z",
+    "2025-01-01",  # Date only format
+)
+
+# Content whose first field value is missing or invalid, with the extract_* function
+# and the value it should fall back to
+_FALLBACK_CASES = (
+    ("Priority: whenever\n[HIGH]", extract_priority, "High"),
+    ("Create Date: soon\nCreated: 2025-02-02", extract_create_date, "2025-02-02"),
+    ("Finished Date: never\nCompleted: 2025-04-04", extract_finished_date, "2025-04-04"),
+    ("Owner @bob", extract_assignee, "bob"),
+    ("See T-9 and [ABC-12]", extract_task_id, "ABC-12"),
+    ("\u0130d: 7", extract_task_id, "7"),  # IGNORECASE equates the dotted I with "i"
 )
 
 
+# Independent per-field patterns the single-scan extractors must agree with; each
+# field lists its patterns in fallback order
+_REFERENCE_PATTERNS = {
+    "task_id": (
+        re.compile(r"ID:\s*([^\n\s]+)", re.IGNORECASE),
+        re.compile(r"\[([A-Z]+-\d+)\]"),
+        re.compile(r"(T-\d+)"),
+    ),
+    "priority": (
+        re.compile(r"Priority:\s*([^\n]+)", re.IGNORECASE),
+        re.compile(r"\[([A-Z]+)\]"),
+    ),
+    "assignee": (
+        re.compile(r"Assignee:\s*([^\n]+)", re.IGNORECASE),
+        re.compile(r"@([a-zA-Z0-9_-]+)"),
+    ),
+    "create_date": (
+        re.compile(r"Create\s+Date:\s*([^\n]+)", re.IGNORECASE),
+        re.compile(r"Created:\s*([^\n]+)", re.IGNORECASE),
+    ),
+    "finished_date": (
+        re.compile(r"Finished\s+Date:\s*([^\n]+)", re.IGNORECASE),
+        re.compile(r"Completed:\s*([^\n]+)", re.IGNORECASE),
+        re.compile(r"Finished:\s*([^\n]+)", re.IGNORECASE),
+    ),
+}
+_REFERENCE_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_REFERENCE_PRIORITIES = {"high", "medium", "low", "critical", "urgent"}
+
+
+def _reference_fields(content):
+    """Extract the scanned fields with one regex search per pattern."""
+    fields = {}
+    for field, patterns in _REFERENCE_PATTERNS.items():
+        fields[field] = ""
+        for pattern in patterns:
+            match = pattern.search(content)
+            if not match:
+                continue
+            value = match.group(1).strip()
+            if field == "priority" and value.lower() not in _REFERENCE_PRIORITIES:
+                continue
+            if field.endswith("_date") and not _REFERENCE_DATE_RE.match(value):
+                continue
+            fields[field] = value.title() if field == "priority" else value
+            break
+    return fields
+
+
 class TestValidationUtils(unittest.TestCase):
     """Test cases for validation_utils module."""
 
@@ -42,23 +135,24 @@ class TestValidationUtils(unittest.TestCase):
             "TODO: Something to do",  # TODO format is valid
             "TASK: Something to do",  # TASK format is valid
             "Action: Do something",  # Action format is valid
+            "Fix login bug T-42",  # Task ID references are valid
+            "Follow up on ID: 7",
         ]
 
-        for line in valid_lines:
-            with self.subTest(line=line):
-                self.assertTrue(is_valid_task_line(line))
+        rejected = [line for line in valid_lines if not is_valid_task_line(line)]
+        self.assertEqual(rejected, [], f"valid lines rejected: {rejected}")
 
         # Invalid task lines - only truly invalid ones
         invalid_lines = [
             "Not a task line",
             "Just some random text",
+            "lowercase t-42 and id: 7",  # ID patterns are case-sensitive
             "",
             None,
         ]
 
-        for line in invalid_lines:
-            with self.subTest(line=line):
-                self.assertFalse(is_valid_task_line(line))
+        accepted = [line for line in invalid_lines if is_valid_task_line(line)]
+        self.assertEqual(accepted, [], f"invalid lines accepted: {accepted}")
 
     def test_extract_task_id(self):
         """Test extract_task_id function."""
@@ -101,9 +195,7 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(extracted_id5, "T-111")
 
         # No ID present
-        task_no_id = """- [ ] **Test Task**:
-    - Priority: High
-    - Description: No ID"""
+        task_no_id = _make_task_text("Priority", "High")
 
         extracted_id6 = extract_task_id(task_no_id)
         self.assertEqual(extracted_id6, "")  # Returns empty string, not None
@@ -111,18 +203,8 @@ class TestValidationUtils(unittest.TestCase):
     def test_extract_priority(self):
         """Test extract_priority function."""
         # Valid priorities
-        priorities_map = {
-            "Low": "Low",
-            "Medium": "Medium",
-            "High": "High",
-            "Critical": "Critical",
-            "urgent": "Urgent",  # Should be title-cased
-        }
-
-        for priority_str, expected_priority in priorities_map.items():
-            task_text = f"""- [ ] **Test Task**:
-    - Priority: {priority_str}
-    - Description: Test"""
+        for priority_str, expected_priority in _PRIORITY_CASES:
+            task_text = _make_task_text("Priority", priority_str)
 
             with self.subTest(priority=priority_str):
                 extracted_priority = extract_priority(task_text)
@@ -144,9 +226,7 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(extracted_priority3, "")  # Returns empty string, not None
 
         # Invalid priority
-        task_invalid_priority = """- [ ] **Test Task**:
-    - Priority: InvalidPriority
-    - Description: Test"""
+        task_invalid_priority = _make_task_text("Priority", "InvalidPriority")
 
         extracted_priority4 = extract_priority(task_invalid_priority)
         self.assertEqual(extracted_priority4, "")  # Returns empty string for invalid priority
@@ -154,17 +234,13 @@ class TestValidationUtils(unittest.TestCase):
     def test_extract_assignee(self):
         """Test extract_assignee function."""
         # Valid assignee with "Assignee:" format
-        task_with_assignee = """- [ ] **Test Task**:
-    - Assignee: JohnDoe
-    - Priority: High"""
+        task_with_assignee = _make_task_text("Assignee", "JohnDoe")
 
         extracted_assignee = extract_assignee(task_with_assignee)
         self.assertEqual(extracted_assignee, "JohnDoe")
 
         # Assignee with spaces and special characters
-        task_complex_assignee = """- [ ] **Test Task**:
-    - Assignee: John Doe Jr.
-    - Priority: Medium"""
+        task_complex_assignee = _make_task_text("Assignee", "John Doe Jr.")
 
         extracted_assignee2 = extract_assignee(task_complex_assignee)
         self.assertEqual(extracted_assignee2, "John Doe Jr.")
@@ -177,9 +253,7 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(extracted_assignee3, "johndoe")
 
         # No assignee
-        task_no_assignee = """- [ ] **Test Task**:
-    - Priority: High
-    - Description: No assignee"""
+        task_no_assignee = _make_task_text("Priority", "High")
 
         extracted_assignee4 = extract_assignee(task_no_assignee)
         self.assertEqual(extracted_assignee4, "")  # Returns empty string, not None
@@ -187,42 +261,32 @@ class TestValidationUtils(unittest.TestCase):
     def test_extract_create_date(self):
         """Test extract_create_date function."""
         # Valid ISO8601 date with "Create Date:" format
-        task_with_date = """- [ ] **Test Task**:
-    - Create Date: 2025-01-01T12:00:00Z
-    - Priority: High"""
+        task_with_date = _make_task_text("Create Date", "2025-01-01T12:00:00Z")
 
         extracted_date = extract_create_date(task_with_date)
         self.assertEqual(extracted_date, "2025-01-01T12:00:00Z")
         self.assertIsInstance(extracted_date, str)
 
         # Valid date with "Created:" format
-        task_created_format = """- [ ] **Test Task**:
-    - Created: 2025-01-02T10:30:00Z
-    - Priority: Medium"""
+        task_created_format = _make_task_text("Created", "2025-01-02T10:30:00Z")
 
         extracted_date2 = extract_create_date(task_created_format)
         self.assertEqual(extracted_date2, "2025-01-02T10:30:00Z")
 
         # Date without time part
-        task_date_only = """- [ ] **Test Task**:
-    - Create Date: 2025-01-03
-    - Priority: Low"""
+        task_date_only = _make_task_text("Create Date", "2025-01-03")
 
         extracted_date3 = extract_create_date(task_date_only)
         self.assertEqual(extracted_date3, "2025-01-03")
 
         # No date present
-        task_no_date = """- [ ] **Test Task**:
-    - Priority: High
-    - Description: No date"""
+        task_no_date = _make_task_text("Priority", "High")
 
         extracted_date4 = extract_create_date(task_no_date)
         self.assertEqual(extracted_date4, "")  # Returns empty string, not None
 
         # Invalid date format (doesn't match YYYY-MM-DD pattern)
-        task_invalid_date = """- [ ] **Test Task**:
-    - Create Date: invalid-date-format
-    - Priority: High"""
+        task_invalid_date = _make_task_text("Create Date", "invalid-date-format")
 
         extracted_date5 = extract_create_date(task_invalid_date)
         self.assertEqual(extracted_date5, "")  # Returns empty string for invalid format
@@ -240,33 +304,25 @@ class TestValidationUtils(unittest.TestCase):
         self.assertIsInstance(extracted_date, str)
 
         # Valid date with "Completed:" format
-        task_completed_format = """- [x] **Completed Task**:
-    - Completed: 2025-01-03T16:45:00Z
-    - Priority: Medium"""
+        task_completed_format = _make_task_text("Completed", "2025-01-03T16:45:00Z")
 
         extracted_date2 = extract_finished_date(task_completed_format)
         self.assertEqual(extracted_date2, "2025-01-03T16:45:00Z")
 
         # Valid date with "Finished:" format
-        task_finished_format = """- [x] **Completed Task**:
-    - Finished: 2025-01-04T17:00:00Z
-    - Priority: Low"""
+        task_finished_format = _make_task_text("Finished", "2025-01-04T17:00:00Z")
 
         extracted_date3 = extract_finished_date(task_finished_format)
         self.assertEqual(extracted_date3, "2025-01-04T17:00:00Z")
 
         # No finished date (open task)
-        task_no_finished = """- [ ] **Open Task**:
-    - Create Date: 2025-01-01T12:00:00Z
-    - Priority: Medium"""
+        task_no_finished = _make_task_text("Create Date", "2025-01-01T12:00:00Z")
 
         extracted_date4 = extract_finished_date(task_no_finished)
         self.assertEqual(extracted_date4, "")  # Returns empty string, not None
 
         # Invalid finished date format
-        task_invalid_finished = """- [x] **Completed Task**:
-    - Finished Date: invalid-date
-    - Priority: High"""
+        task_invalid_finished = _make_task_text("Finished Date", "invalid-date")
 
         extracted_date5 = extract_finished_date(task_invalid_finished)
         self.assertEqual(extracted_date5, "")  # Returns empty string for invalid format
@@ -362,7 +418,7 @@ class TestValidationUtils(unittest.TestCase):
         result = validate_task_schema(valid_task_data)
         self.assertIsInstance(result, ValidationResult)
         self.assertTrue(result.is_valid)
-        self.assertEqual(len(result.errors), 0)
+        self.assertFalse(result.errors)
 
         # Schema validation with missing required fields
         invalid_task_data = {
@@ -400,35 +456,25 @@ class TestValidationUtils(unittest.TestCase):
         self.assertFalse(result4.is_valid)
         self.assertGreater(len(result4.errors), 0)
 
-        # Non-dict input - the current implementation has a bug where it tries to access
-        # .keys() before checking isinstance, so this will raise AttributeError
-        # Test with empty dict instead
+        # Empty dict
         result5 = validate_task_schema({})
         self.assertIsInstance(result5, ValidationResult)
         self.assertFalse(result5.is_valid)
         self.assertGreater(len(result5.errors), 0)  # Should have missing required fields
 
+        # Non-dict input is reported instead of raising
+        result6 = validate_task_schema(["title", "task_id"])
+        self.assertFalse(result6.is_valid)
+        self.assertEqual(result6.errors, ["Task data must be a dictionary"])
+
     def test_date_parsing_edge_cases(self):
         """Test date parsing with various edge cases."""
-        # Different valid ISO8601 formats
-        date_formats = [
-            "2025-01-01T12:00:00Z",
-            "2025-01-01T12:00:00+00:00",
-            "2025-01-01T12:00:00.000Z",
-            "2025-01-01",  # Date only format
-        ]
-
-        for date_str in date_formats:
-            task_text = f"""- [ ] **Date Test**:
-    - Create Date: {date_str}
-    - Priority: High"""
-
-            with self.subTest(date_format=date_str):
-                extracted_date = extract_create_date(task_text)
-                if date_str.startswith("2025-01-01"):  # Basic date format check
-                    # Should extract dates that match YYYY-MM-DD pattern
-                    self.assertIsInstance(extracted_date, str)
-                    self.assertTrue(extracted_date.startswith("2025-01-01"))
+        # Every format starts with YYYY-MM-DD, so each is extracted verbatim
+        extracted = tuple(
+            extract_create_date(_make_task_text("Create Date", date_str))
+            for date_str in _DATE_FORMATS
+        )
+        self.assertEqual(extracted, _DATE_FORMATS)
 
     def test_extraction_functions_with_multiple_matches(self):
         """Test extraction functions when multiple matches might exist."""
@@ -450,26 +496,246 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(extracted_priority, "High")  # First Priority match
         self.assertEqual(extracted_date, "2025-01-01T12:00:00Z")  # First Create Date match
 
+    def test_extraction_fallbacks(self):
+        """Test that extractors fall back to the next pattern when the first fails."""
+        for content, extractor, expected in _FALLBACK_CASES:
+            with self.subTest(extractor=extractor.__name__, content=content):
+                self.assertEqual(extractor(content), expected)
+
     def test_edge_cases_and_robustness(self):
         """Test edge cases and robustness of validation functions."""
-        # Test with None inputs - only test functions that handle None properly
-        self.assertEqual(extract_description(None), "")  # This function handles None
-        self.assertFalse(is_valid_task_line(None))
-        self.assertFalse(validate_task_format(None))
-
-        # Most extract functions don't handle None - they call re.search directly
-        # Test with empty strings instead
-        self.assertEqual(extract_task_id(""), "")
-        self.assertEqual(extract_priority(""), "")
-        self.assertEqual(extract_assignee(""), "")
-        self.assertEqual(extract_create_date(""), "")
-        self.assertEqual(extract_finished_date(""), "")
-        self.assertEqual(extract_description(""), "")
-        self.assertFalse(is_valid_task_line(""))
-        self.assertFalse(validate_task_format(""))
-
-        # Test with non-string inputs (for functions that should handle them)
-        self.assertEqual(extract_description(123), "")  # Non-string input
+        # Test with None and empty inputs
+        extractors = (
+            extract_task_id,
+            extract_priority,
+            extract_assignee,
+            extract_create_date,
+            extract_finished_date,
+            extract_description,
+        )
+        non_empty = [
+            (extractor.__name__, value)
+            for extractor in extractors
+            for value in (None, "")
+            if extractor(value) != ""
+        ]
+        self.assertEqual(non_empty, [], f"extractors returned values for: {non_empty}")
+        accepted = [
+            (check.__name__, value)
+            for check in (is_valid_task_line, validate_task_format)
+            for value in (None, "")
+            if check(value)
+        ]
+        self.assertEqual(accepted, [], f"line checks accepted: {accepted}")
+
+        # Test with non-string inputs, including unhashable ones the memo cache cannot key
+        self.assertEqual(extract_description(123), "")
+        self.assertEqual(extract_priority(["Priority: High"]), "")
+        empty_fields = dict.fromkeys(
+            (
+                "task_id",
+                "priority",
+                "assignee",
+                "create_date",
+                "finished_date",
+                "description",
+            ),
+            "",
+        )
+        for value in (None, 123, ["Priority: High"]):
+            with self.subTest(value=value):
+                self.assertEqual(extract_task_fields(value), empty_fields)
+
+    def test_extract_task_fields_matches_extractors(self):
+        """Test that the single-scan extractors agree with per-field reference patterns."""
+        fragments = [
+            "Assignee: Alice",
+            "assignee:   ",
+            "@bob",
+            "Create Date: 2025-01-01T12:00:00Z",
+            "Create Date: soon",
+            "Created: 2025-02-02",
+            "Finished Date: 2025-03-03",
+            "Finished Date: never",
+            "Completed: 2025-04-04",
+            "Finished: 2025-05-05",
+            "ID: 42",
+            "Task ID: T-7",
+            "Paid: 10",
+            "[ABC-12]",
+            "T-99",
+            "Priority: high",
+            "Priority: whenever",
+            "[LOW]",
+            "[X]",
+            "**Bold** and *italic*",
+            "# Heading",
+            "",
+        ]
+        rng = random.Random(1234)
+        samples = ["", "no fields here"]
+        for _ in range(100):
+            picked = rng.sample(fragments, rng.randint(1, 6))
+            samples.append(rng.choice(["\n", " ", " - "]).join(picked))
+
+        for content in samples:
+            with self.subTest(content=content):
+                expected = _reference_fields(content)
+                self.assertEqual(
+                    {
+                        "task_id": extract_task_id(content),
+                        "priority": extract_priority(content),
+                        "assignee": extract_assignee(content),
+                        "create_date": extract_create_date(content),
+                        "finished_date": extract_finished_date(content),
+                    },
+                    expected,
+                )
+                self.assertEqual(
+                    extract_task_fields(content),
+                    {**expected, "description": extract_description(content)},
+                )
+
+    def test_validate_tasks_file_duplicate_ids(self):
+        """Test that each repeated task ID is reported once."""
+
+        def make_task(task_id):
+            return TaskInfo(
+                title=f"Task {task_id}",
+                checked=False,
+                task_id=task_id,
+                priority="High",
+                assignee="TestUser",
+                create_date="2025-01-01T12:00:00Z",
+                start_date=None,
+                finish_date=None,
+                estimated_time=None,
+                description="A task",
+                prerequisites=[],
+                subtasks={},
+                raw_block="",
+            )
+
+        tasks = {str(i): make_task(task_id) for i, task_id in enumerate([1, 2, 1, 3, 1, 2])}
+        with tempfile.TemporaryDirectory() as tmp:
+            tasks_file = pathlib.Path(tmp) / "TASKS.md"
+            tasks_file.write_text("# Tasks\n")
+            result = validate_tasks_file(tasks_file, lambda content: tasks)
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, ["Duplicate task IDs found: [1, 2]"])
+
+    def test_validate_tasks_file_missing(self):
+        """Test that a missing tasks file is reported without parsing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            tasks_file = pathlib.Path(tmp) / "TASKS.md"
+            result = validate_tasks_file(tasks_file, lambda content: self.fail("parsed"))
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, [f"Tasks file does not exist: {tasks_file}"])
+
+    def test_validate_tasks_file_line_count(self):
+        """Test that line_count ignores a trailing newline."""
+        cases = {"": 0, "# Tasks": 1, "# Tasks\n": 1, "# Tasks\n\nMore": 3}
+        with tempfile.TemporaryDirectory() as tmp:
+            tasks_file = pathlib.Path(tmp) / "TASKS.md"
+            for content, expected in cases.items():
+                with self.subTest(content=content):
+                    tasks_file.write_text(content)
+                    result = validate_tasks_file(tasks_file, lambda content: {})
+                    self.assertEqual(result.context["line_count"], expected)
+
+    def test_verify_operation_safety_target_types(self):
+        """Test verify_operation_safety with file, directory and missing targets."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            existing_file = root / "TASKS.md"
+            existing_file.write_text("# Tasks\n")
+
+            result = verify_operation_safety(
+                "update", [existing_file, root / "new.md", root / "missing" / "new.md"]
+            )
+            self.assertTrue(result.is_valid)
+            self.assertIn(f"Parent directory will be created: {root / 'missing'}", result.warnings)
+
+            # Siblings sharing a parent each still report it, from one lookup
+            siblings = [root / "missing" / "a.md", root / "missing" / "b.md"]
+            with patch("taskautomation.validation_utils.os.access") as mock_access:
+                result = verify_operation_safety("update", siblings + [root / "c.md"])
+            missing_warning = f"Parent directory will be created: {root / 'missing'}"
+            self.assertEqual(result.warnings.count(missing_warning), 2)
+            mock_access.assert_called_once_with(root, os.W_OK)
+
+            result = verify_operation_safety("update", [root])
+            self.assertFalse(result.is_valid)
+            self.assertEqual(result.errors, [f"Target is not a file: {root}"])
+
+    def test_verify_operation_safety_reuses_git_info(self):
+        """Test that a supplied git_info avoids spawning git."""
+        with tempfile.TemporaryDirectory() as tmp:
+            target = pathlib.Path(tmp) / "TASKS.md"
+            with patch("taskautomation.validation_utils.run_git_command") as mock_git:
+                result = verify_operation_safety(
+                    "update", [target], git_info={"has_uncommitted": True}
+                )
+
+        mock_git.assert_not_called()
+        self.assertIn("Working directory has uncommitted changes", result.warnings)
+
+    def test_validate_prerequisites_git_checks_avoid_subprocesses(self):
+        """Test that git is probed once per process and .git skips rev-parse."""
+        validation_utils._git_available.cache_clear()
+        self.addCleanup(validation_utils._git_available.cache_clear)
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            (root / ".git").mkdir()
+            with patch(
+                "taskautomation.validation_utils.run_git_command",
+                return_value=(True, "git version 2.0", ""),
+            ) as mock_git:
+                first = validate_prerequisites(root)
+                second = validate_prerequisites(root)
+
+        mock_git.assert_called_once_with(["--version"])
+        for result in (first, second):
+            self.assertTrue(result.context["git_available"])
+            self.assertTrue(result.context["is_git_repo"])
+
+    def test_validate_task_data_memoized_result_is_not_shared(self):
+        """Test that repeated validation returns equal but independent results."""
+        task = TaskInfo(
+            title="",
+            checked=True,
+            task_id=7,
+            priority="Urgent",
+            assignee=None,
+            create_date="2024-01-02T00:00:00Z",
+            start_date="2024-01-01T00:00:00Z",
+            finish_date=None,
+            estimated_time=None,
+            description=None,
+            prerequisites=[],
+            subtasks={"a": True, "b": False},
+            raw_block="",
+        )
+
+        first = validate_task_data(task)
+        first.errors.append("caller mutation")
+        first.context["extra"] = True
+        second = validate_task_data(task)
+
+        self.assertFalse(second.is_valid)
+        self.assertEqual(len(second.errors), 2)
+        self.assertNotIn("caller mutation", second.errors)
+        self.assertNotIn("extra", second.context)
+        self.assertEqual(
+            second.warnings,
+            [
+                "Start date is before create date",
+                "Completed task should have a finish date",
+                "Main task is completed but some subtasks are not",
+            ],
+        )
 
 
 if __name__ == "__main__":